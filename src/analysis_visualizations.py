@@ -3,19 +3,21 @@ Comprehensive Analysis & Visualization Script
 8 Detailed Analyses with Professional Visualizations for Civil Engineering + AI Data
 """
 
+import hashlib
+import multiprocessing
 import sqlite3
-import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from collections import Counter
 
+import orjson
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only ever saved, never shown
 import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import seaborn as sns
-from wordcloud import WordCloud
 
 # Configuration
 plt.style.use('seaborn-v0_8-whitegrid')
@@ -33,48 +35,132 @@ COLORS = {
     'gradient': ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#3A5A40', '#6B4226', '#8B5CF6', '#06B6D4']
 }
 
+DB_PATH = Path(__file__).parent.parent / 'data' / 'processed' / 'articles.db'
 OUTPUT_DIR = Path(__file__).parent.parent / 'outputs' / 'visualizations'
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Precomputed aggregations are cached here between runs, keyed by the
+# database file's mtime+size so any new batch invalidates the cache
+CACHE_DIR = OUTPUT_DIR / '.cache'
+
+# Shared savefig settings: 150 dpi is plenty for on-screen dashboards, and
+# the light PNG compression settings skip Pillow's slow auto-filter pass
+SAVE_KW = dict(dpi=150, bbox_inches='tight', facecolor='white',
+               pil_kwargs={'compress_level': 1, 'optimize': False})
+
+# One figure reused by all analyses; creating and closing a fresh figure
+# per analysis reallocates the Agg backing buffers every time
+_FIG = None
+
+
+@lru_cache(maxsize=64)
+def _palette(name, n, lo=0.0, hi=1.0, reverse=False):
+    """Sample n colors from a named colormap, cached per combination"""
+    arr = getattr(plt.cm, name)(np.linspace(lo, hi, n))
+    return arr[::-1] if reverse else arr
+
+
+def _get_fig(figsize):
+    """Return the shared analysis figure, cleared and resized"""
+    global _FIG
+    if _FIG is None:
+        _FIG = plt.figure(figsize=figsize, layout='constrained')
+    else:
+        _FIG.clear()
+        _FIG.set_size_inches(*figsize)
+    return _FIG
+
 def load_data():
     """Load data from SQLite database"""
-    db_path = Path(__file__).parent.parent / 'data' / 'processed' / 'articles.db'
-    conn = sqlite3.connect(db_path)
-    
-    # Load accepted articles
-    df = pd.read_sql_query("SELECT * FROM articles", conn)
-    df_rejected = pd.read_sql_query("SELECT * FROM rejected", conn)
-    
+    conn = sqlite3.connect(DB_PATH)
+
+    # Stream accepted articles in chunks instead of materializing the whole
+    # table through a single fetch; only the columns the analyses actually
+    # read are projected, which keeps full_text/summary out of memory
+    query = """SELECT category, published_at, keywords, application_stage,
+                      source_name, source_type, civil_engineering_area, ai_technique
+               FROM articles"""
+    chunks = pd.read_sql_query(query, conn, chunksize=5000)
+    df = pd.concat(chunks, ignore_index=True)
+
+    # Only the count of rejected articles is ever used downstream
+    rejected_count = conn.execute("SELECT COUNT(*) FROM rejected").fetchone()[0]
+
     conn.close()
     
-    # Parse dates
-    df['published_at'] = pd.to_datetime(df['published_at'], errors='coerce')
+    # Parse dates on the fast C path (timestamps are stored as ISO 8601)
+    df['published_at'] = pd.to_datetime(df['published_at'], format='ISO8601', cache=True, errors='coerce')
     df['year'] = df['published_at'].dt.year
-    df['month'] = df['published_at'].dt.to_period('M')
     df['year_month'] = df['published_at'].dt.strftime('%Y-%m')
-    
-    # Parse keywords JSON
-    df['keywords_list'] = df['keywords'].apply(lambda x: json.loads(x) if pd.notna(x) and x else [])
-    
-    return df, df_rejected
+
+    # Parse keywords JSON with orjson; a plain list comprehension avoids
+    # pandas' per-row apply dispatch
+    df['keywords_list'] = [orjson.loads(x) if x else [] for x in df['keywords'].fillna('').to_numpy()]
+
+    # Low-cardinality grouping columns become categoricals so repeated
+    # groupbys work on integer codes instead of re-hashing strings
+    for col in ('category', 'ai_technique', 'civil_engineering_area', 'application_stage'):
+        df[col] = df[col].astype('category')
+
+    return df, rejected_count
+
+
+def _two_way(df, a, b):
+    """Two-way count table; faster than pd.crosstab, which re-categorizes"""
+    return df.groupby([a, b], observed=True).size().unstack(fill_value=0)
+
+
+def precompute(df):
+    """Compute the aggregations shared by several analyses in one place
+
+    Results are cached to disk so warm reruns while tweaking a single plot
+    skip the whole groupby pipeline as long as the database is unchanged.
+    """
+    stat = DB_PATH.stat()
+    cache_key = hashlib.sha256(f"{stat.st_mtime}:{stat.st_size}".encode()).hexdigest()[:16]
+    cache_file = CACHE_DIR / f'agg_{cache_key}.pkl'
+    if cache_file.exists():
+        return pd.read_pickle(cache_file)
+
+    df_dated = df[df['published_at'].notna()]
+
+    agg = {
+        'cat_counts': df['category'].value_counts(sort=False),
+        'tech_counts': df['ai_technique'].value_counts(sort=False),
+        'area_counts': df['civil_engineering_area'].value_counts(sort=False),
+        'stage_counts': df['application_stage'].value_counts(),
+        'source_counts': df['source_name'].value_counts(sort=False),
+        'source_type_counts': df['source_type'].value_counts(),
+        'df_dated': df_dated,
+        'monthly': df_dated.groupby('year_month').size().sort_index(),
+        'stage_cat': _two_way(df, 'application_stage', 'category'),
+        'area_tech': _two_way(df, 'civil_engineering_area', 'ai_technique'),
+        'tech_cat': _two_way(df, 'ai_technique', 'category'),
+        'cat_month': _two_way(df_dated, 'category', 'year_month'),
+    }
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    pd.to_pickle(agg, cache_file)
+    return agg
 
 
 # =============================================================================
 # ANALYSIS 1: Category Distribution
 # =============================================================================
-def analysis_1_category_distribution(df):
+def analysis_1_category_distribution(df, agg):
     """Analyze and visualize category distribution"""
     print("📊 Analysis 1: Category Distribution")
-    
+
     # Clean and normalize categories
-    category_counts = df['category'].value_counts().head(12)
+    category_counts = agg['cat_counts'].nlargest(12)
     
     # Create figure with 2 subplots
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    fig = _get_fig((16, 7))
+    axes = fig.subplots(1, 2)
     
     # 1. Horizontal Bar Chart
     ax1 = axes[0]
-    colors = plt.cm.Blues(np.linspace(0.4, 0.9, len(category_counts)))[::-1]
+    colors = _palette('Blues', len(category_counts), 0.4, 0.9, reverse=True)
     bars = ax1.barh(category_counts.index, category_counts.values, color=colors, edgecolor='white', linewidth=0.5)
     ax1.set_xlabel('Number of Articles')
     ax1.set_title('AI in Civil Engineering: Category Distribution', fontweight='bold', pad=15)
@@ -95,39 +181,37 @@ def analysis_1_category_distribution(df):
     else:
         pie_data = top_categories
     
-    colors_pie = plt.cm.Set3(np.linspace(0, 1, len(pie_data)))
+    colors_pie = _palette('Set3', len(pie_data))
     wedges, texts, autotexts = ax2.pie(pie_data.values, labels=pie_data.index, autopct='%1.1f%%',
                                         colors=colors_pie, startangle=90, pctdistance=0.75)
     ax2.set_title('Category Share Distribution', fontweight='bold', pad=15)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '1_category_distribution.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '1_category_distribution.png', **SAVE_KW)
     print(f"  ✓ Saved: 1_category_distribution.png")
 
 
 # =============================================================================
 # ANALYSIS 2: Time-based Trend Analysis
 # =============================================================================
-def analysis_2_time_trends(df):
+def analysis_2_time_trends(df, agg):
     """Analyze and visualize time-based trends"""
     print("📊 Analysis 2: Time-based Trends")
-    
+
     # Filter valid dates
-    df_dated = df[df['published_at'].notna()].copy()
-    
+    df_dated = agg['df_dated']
+
     if len(df_dated) < 10:
         print("  ⚠ Not enough dated articles for trend analysis")
         return
-    
+
     # Monthly trend
-    monthly_counts = df_dated.groupby('year_month').size().reset_index(name='count')
-    monthly_counts = monthly_counts.sort_values('year_month')
-    
+    monthly_counts = agg['monthly'].reset_index(name='count')
+
     # Get top 5 categories for trend
-    top_categories = df_dated['category'].value_counts().head(5).index.tolist()
+    top_categories = df_dated['category'].value_counts(sort=False).nlargest(5).index.tolist()
     
-    fig, axes = plt.subplots(2, 1, figsize=(14, 10))
+    fig = _get_fig((14, 10))
+    axes = fig.subplots(2, 1)
     
     # 1. Overall trend line
     ax1 = axes[0]
@@ -143,12 +227,13 @@ def analysis_2_time_trends(df):
     
     # 2. Category trends
     ax2 = axes[1]
-    colors = plt.cm.tab10(np.linspace(0, 1, len(top_categories)))
+    colors = _palette('tab10', len(top_categories))
     
+    # One category × month table covers all five trends instead of a
+    # filter + groupby pass per category
+    cat_month = agg['cat_month'].reindex(columns=monthly_counts['year_month'], fill_value=0)
     for idx, cat in enumerate(top_categories):
-        cat_monthly = df_dated[df_dated['category'] == cat].groupby('year_month').size()
-        cat_monthly = cat_monthly.reindex(monthly_counts['year_month'], fill_value=0)
-        ax2.plot(range(len(cat_monthly)), cat_monthly.values, 
+        ax2.plot(range(cat_month.shape[1]), cat_month.loc[cat].values,
                 label=cat, linewidth=2, marker='o', markersize=4, color=colors[idx])
     
     ax2.set_xticks(range(0, len(monthly_counts), max(1, len(monthly_counts)//10)))
@@ -159,26 +244,25 @@ def analysis_2_time_trends(df):
     ax2.legend(loc='upper left', bbox_to_anchor=(1.02, 1))
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '2_time_trends.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '2_time_trends.png', **SAVE_KW)
     print(f"  ✓ Saved: 2_time_trends.png")
 
 
 # =============================================================================
 # ANALYSIS 3: Application Stage Distribution
 # =============================================================================
-def analysis_3_application_stage(df):
+def analysis_3_application_stage(df, agg):
     """Analyze and visualize application stage distribution"""
     print("📊 Analysis 3: Application Stage Distribution")
+
+    stage_counts = agg['stage_counts']
     
-    stage_counts = df['application_stage'].value_counts()
-    
-    fig, axes = plt.subplots(1, 2, figsize=(15, 6))
+    fig = _get_fig((15, 6))
+    axes = fig.subplots(1, 2)
     
     # 1. Donut Chart
     ax1 = axes[0]
-    colors = plt.cm.Pastel1(np.linspace(0, 1, len(stage_counts)))
+    colors = _palette('Pastel1', len(stage_counts))
     wedges, texts, autotexts = ax1.pie(stage_counts.values, labels=stage_counts.index, 
                                         autopct='%1.1f%%', colors=colors,
                                         wedgeprops=dict(width=0.6), startangle=90)
@@ -191,43 +275,37 @@ def analysis_3_application_stage(df):
     ax2 = axes[1]
     
     # Cross-tabulation with category
-    stage_cat = pd.crosstab(df['application_stage'], df['category'])
-    top_cats = df['category'].value_counts().head(6).index
-    stage_cat = stage_cat[top_cats]
+    top_cats = agg['cat_counts'].nlargest(6).index
+    stage_cat = agg['stage_cat'][top_cats]
     
     stage_cat.plot(kind='barh', stacked=True, ax=ax2, colormap='Set2', edgecolor='white', linewidth=0.5)
     ax2.set_xlabel('Number of Articles')
     ax2.set_title('Application Stage × Category Breakdown', fontweight='bold', pad=15)
     ax2.legend(title='Category', bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '3_application_stage.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '3_application_stage.png', **SAVE_KW)
     print(f"  ✓ Saved: 3_application_stage.png")
 
 
 # =============================================================================
 # ANALYSIS 4: Keyword Analysis
 # =============================================================================
-def analysis_4_keywords(df):
+def analysis_4_keywords(df, agg):
     """Analyze and visualize keyword distribution"""
     print("📊 Analysis 4: Keyword Analysis")
     
-    # Extract all keywords
-    all_keywords = []
-    for kw_list in df['keywords_list']:
-        if isinstance(kw_list, list):
-            all_keywords.extend([kw.lower().strip() for kw in kw_list if kw])
-    
-    keyword_counts = Counter(all_keywords)
-    top_keywords = keyword_counts.most_common(20)
-    
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
-    
+    # Flatten all keyword lists in one vectorized pass
+    kw_series = df['keywords_list'].explode().dropna()
+    kw_series = kw_series[kw_series != ''].str.lower().str.strip()
+    keyword_counts = kw_series.value_counts()
+    top_keywords = keyword_counts.head(20)
+
+    fig = _get_fig((9, 7))
+    ax1 = fig.subplots()
+
     # 1. Bar Chart
-    ax1 = axes[0]
-    keywords, counts = zip(*top_keywords) if top_keywords else ([], [])
-    colors = plt.cm.viridis(np.linspace(0.2, 0.8, len(keywords)))
+    keywords, counts = top_keywords.index.tolist(), top_keywords.values.tolist()
+    colors = _palette('viridis', len(keywords), 0.2, 0.8)
     bars = ax1.barh(list(keywords)[::-1], list(counts)[::-1], color=colors[::-1], edgecolor='white')
     ax1.set_xlabel('Frequency')
     ax1.set_title('Top 20 Keywords in AI + Civil Engineering', fontweight='bold', pad=15)
@@ -237,37 +315,37 @@ def analysis_4_keywords(df):
         ax1.text(val + 0.5, bar.get_y() + bar.get_height()/2, f'{val}', 
                 va='center', fontsize=10)
     
-    # 2. Word Cloud
-    ax2 = axes[1]
-    if keyword_counts:
+    fig.savefig(OUTPUT_DIR / '4_keywords.png', **SAVE_KW)
+    print(f"  ✓ Saved: 4_keywords.png")
+
+    # 2. Word Cloud - written straight to PNG instead of being routed
+    # through imshow, which would resample and re-encode the bitmap
+    if len(keyword_counts):
+        from wordcloud import WordCloud  # deferred: pulls in PIL at import
         wordcloud = WordCloud(width=800, height=400, background_color='white',
                              colormap='viridis', max_words=100, max_font_size=100,
-                             prefer_horizontal=0.7).generate_from_frequencies(keyword_counts)
-        ax2.imshow(wordcloud, interpolation='bilinear')
-        ax2.axis('off')
-        ax2.set_title('Keyword Word Cloud', fontweight='bold', pad=15)
-    
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '4_keywords.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"  ✓ Saved: 4_keywords.png")
+                             prefer_horizontal=0.7).generate_from_frequencies(keyword_counts.to_dict())
+        wordcloud.to_image().save(OUTPUT_DIR / '4_keywords_wordcloud.png',
+                                  optimize=False, compress_level=1)
+        print(f"  ✓ Saved: 4_keywords_wordcloud.png")
 
 
 # =============================================================================
 # ANALYSIS 5: Source Analysis
 # =============================================================================
-def analysis_5_sources(df):
+def analysis_5_sources(df, agg):
     """Analyze and visualize source distribution"""
     print("📊 Analysis 5: Source Analysis")
+
+    source_counts = agg['source_counts'].nlargest(15)
+    source_type_counts = agg['source_type_counts']
     
-    source_counts = df['source_name'].value_counts().head(15)
-    source_type_counts = df['source_type'].value_counts()
-    
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    fig = _get_fig((16, 7))
+    axes = fig.subplots(1, 2)
     
     # 1. Top Sources Bar Chart
     ax1 = axes[0]
-    colors = plt.cm.RdYlBu(np.linspace(0.2, 0.8, len(source_counts)))
+    colors = _palette('RdYlBu', len(source_counts), 0.2, 0.8)
     ax1.barh(source_counts.index[::-1], source_counts.values[::-1], color=colors, edgecolor='white')
     ax1.set_xlabel('Number of Articles')
     ax1.set_title('Top 15 News/Data Sources', fontweight='bold', pad=15)
@@ -284,35 +362,31 @@ def analysis_5_sources(df):
                                         explode=[0.05]*len(source_type_counts))
     ax2.set_title('Distribution by Source Type', fontweight='bold', pad=15)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '5_sources.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '5_sources.png', **SAVE_KW)
     print(f"  ✓ Saved: 5_sources.png")
 
 
 # =============================================================================
 # ANALYSIS 6: Time-Topic Relationship (Heatmap)
 # =============================================================================
-def analysis_6_time_topic(df):
+def analysis_6_time_topic(df, agg):
     """Analyze and visualize time-topic relationship"""
+    import seaborn as sns  # deferred: only the heatmap needs it
+
     print("📊 Analysis 6: Time-Topic Relationship")
-    
-    df_dated = df[df['published_at'].notna()].copy()
-    
+
+    df_dated = agg['df_dated']
+
     if len(df_dated) < 10:
         print("  ⚠ Not enough dated articles")
         return
-    
-    # Create year-month period
-    df_dated['period'] = df_dated['published_at'].dt.to_period('M').astype(str)
-    
+
     # Get top categories
-    top_cats = df_dated['category'].value_counts().head(8).index.tolist()
-    df_filtered = df_dated[df_dated['category'].isin(top_cats)]
-    
-    # Create pivot table
-    pivot = pd.crosstab(df_filtered['category'], df_filtered['period'])
-    
+    top_cats = df_dated['category'].value_counts(sort=False).nlargest(8).index.tolist()
+
+    # Pivot of category × month restricted to the top categories
+    pivot = agg['cat_month'].loc[agg['cat_month'].index.isin(top_cats)]
+
     # Sort columns by date
     pivot = pivot.reindex(columns=sorted(pivot.columns))
     
@@ -320,7 +394,8 @@ def analysis_6_time_topic(df):
     if len(pivot.columns) > 12:
         pivot = pivot.iloc[:, -12:]  # Last 12 months
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = _get_fig((14, 8))
+    ax = fig.subplots()
     
     # Heatmap
     sns.heatmap(pivot, annot=True, fmt='d', cmap='YlOrRd', 
@@ -332,26 +407,25 @@ def analysis_6_time_topic(df):
     ax.set_title('Topic Evolution Over Time: Heatmap', fontweight='bold', fontsize=16, pad=15)
     
     plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '6_time_topic_heatmap.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '6_time_topic_heatmap.png', **SAVE_KW)
     print(f"  ✓ Saved: 6_time_topic_heatmap.png")
 
 
 # =============================================================================
 # ANALYSIS 7: Civil Engineering Area Distribution
 # =============================================================================
-def analysis_7_civil_eng_areas(df):
+def analysis_7_civil_eng_areas(df, agg):
     """Analyze and visualize civil engineering area distribution"""
     print("📊 Analysis 7: Civil Engineering Areas")
+
+    area_counts = agg['area_counts'].nlargest(10)
     
-    area_counts = df['civil_engineering_area'].value_counts().head(10)
-    
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    fig = _get_fig((16, 7))
+    axes = fig.subplots(1, 2)
     
     # 1. Horizontal Bar Chart
     ax1 = axes[0]
-    colors = plt.cm.Greens(np.linspace(0.3, 0.9, len(area_counts)))[::-1]
+    colors = _palette('Greens', len(area_counts), 0.3, 0.9, reverse=True)
     bars = ax1.barh(area_counts.index[::-1], area_counts.values[::-1], color=colors, edgecolor='white')
     ax1.set_xlabel('Number of Articles')
     ax1.set_title('AI Applications by Civil Engineering Field', fontweight='bold', pad=15)
@@ -364,10 +438,10 @@ def analysis_7_civil_eng_areas(df):
     ax2 = axes[1]
     
     # Cross-tab with AI technique
-    area_technique = pd.crosstab(df['civil_engineering_area'], df['ai_technique'])
+    area_technique = agg['area_tech']
     top_areas = area_counts.head(5).index
-    top_techniques = df['ai_technique'].value_counts().head(5).index
-    
+    top_techniques = agg['tech_counts'].nlargest(5).index
+
     area_technique_filtered = area_technique.loc[area_technique.index.isin(top_areas), top_techniques]
     
     area_technique_filtered.plot(kind='bar', stacked=True, ax=ax2, colormap='Spectral', 
@@ -378,26 +452,25 @@ def analysis_7_civil_eng_areas(df):
     ax2.legend(title='AI Technique', bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=9)
     ax2.tick_params(axis='x', rotation=45)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '7_civil_eng_areas.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '7_civil_eng_areas.png', **SAVE_KW)
     print(f"  ✓ Saved: 7_civil_eng_areas.png")
 
 
 # =============================================================================
 # ANALYSIS 8: AI Technique Distribution
 # =============================================================================
-def analysis_8_ai_techniques(df):
+def analysis_8_ai_techniques(df, agg):
     """Analyze and visualize AI technique distribution"""
     print("📊 Analysis 8: AI Techniques")
+
+    technique_counts = agg['tech_counts'].nlargest(10)
     
-    technique_counts = df['ai_technique'].value_counts().head(10)
-    
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    fig = _get_fig((16, 7))
+    axes = fig.subplots(1, 2)
     
     # 1. Polar/Radar-like Bar Chart
     ax1 = axes[0]
-    colors = plt.cm.plasma(np.linspace(0.2, 0.9, len(technique_counts)))
+    colors = _palette('plasma', len(technique_counts), 0.2, 0.9)
     
     bars = ax1.bar(range(len(technique_counts)), technique_counts.values, 
                    color=colors, edgecolor='white', linewidth=1, width=0.7)
@@ -414,27 +487,19 @@ def analysis_8_ai_techniques(df):
     # 2. Bubble Chart: AI Technique vs Category
     ax2 = axes[1]
     
-    tech_cat = pd.crosstab(df['ai_technique'], df['category'])
+    tech_cat = agg['tech_cat']
     top_techs = technique_counts.head(5).index
-    top_cats = df['category'].value_counts().head(5).index
+    top_cats = agg['cat_counts'].nlargest(5).index
     
     tech_cat_filtered = tech_cat.loc[tech_cat.index.isin(top_techs), top_cats]
     
-    # Create bubble positions
-    x_pos = []
-    y_pos = []
-    sizes = []
-    colors_bubble = []
-    
-    for i, tech in enumerate(tech_cat_filtered.index):
-        for j, cat in enumerate(tech_cat_filtered.columns):
-            x_pos.append(j)
-            y_pos.append(i)
-            sizes.append(tech_cat_filtered.loc[tech, cat] * 20 + 10)
-            colors_bubble.append(tech_cat_filtered.loc[tech, cat])
-    
-    scatter = ax2.scatter(x_pos, y_pos, s=sizes, c=colors_bubble, cmap='YlOrRd', 
-                          alpha=0.7, edgecolors='black', linewidths=0.5)
+    # Create bubble positions with a meshgrid over the crosstab array
+    arr = tech_cat_filtered.to_numpy()
+    ny, nx = arr.shape
+    xi, yi = np.meshgrid(np.arange(nx), np.arange(ny))
+
+    scatter = ax2.scatter(xi.ravel(), yi.ravel(), s=arr.ravel() * 20 + 10, c=arr.ravel(),
+                          cmap='YlOrRd', alpha=0.7, edgecolors='black', linewidths=0.5)
     
     ax2.set_xticks(range(len(tech_cat_filtered.columns)))
     ax2.set_xticklabels(tech_cat_filtered.columns, rotation=45, ha='right', fontsize=10)
@@ -445,23 +510,21 @@ def analysis_8_ai_techniques(df):
     cbar = plt.colorbar(scatter, ax=ax2)
     cbar.set_label('Article Count')
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / '8_ai_techniques.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '8_ai_techniques.png', **SAVE_KW)
     print(f"  ✓ Saved: 8_ai_techniques.png")
 
 
 # =============================================================================
 # SUMMARY DASHBOARD
 # =============================================================================
-def create_summary_dashboard(df, df_rejected):
+def create_summary_dashboard(df, agg, rejected_count):
     """Create a summary dashboard with key metrics"""
     print("📊 Creating Summary Dashboard")
     
-    fig = plt.figure(figsize=(18, 12))
-    
+    fig = plt.figure(figsize=(18, 12), layout='constrained')
+
     # Create grid
-    gs = fig.add_gridspec(3, 3, hspace=0.4, wspace=0.3)
+    gs = fig.add_gridspec(3, 3)
     
     # Title
     fig.suptitle('AI in Civil Engineering: Research & News Analysis Dashboard', 
@@ -471,13 +534,13 @@ def create_summary_dashboard(df, df_rejected):
     ax1 = fig.add_subplot(gs[0, 0])
     ax1.axis('off')
     
-    total = len(df) + len(df_rejected)
+    total = len(df) + rejected_count
     metrics_text = f"""
     📈 KEY METRICS
     ─────────────────
     Total Analyzed: {total}
     AI Relevant: {len(df)} ({len(df)/total*100:.1f}%)
-    Not Relevant: {len(df_rejected)} ({len(df_rejected)/total*100:.1f}%)
+    Not Relevant: {rejected_count} ({rejected_count/total*100:.1f}%)
     
     📅 Date Range:
     {df['published_at'].min().strftime('%Y-%m') if pd.notna(df['published_at'].min()) else 'N/A'} to 
@@ -489,38 +552,36 @@ def create_summary_dashboard(df, df_rejected):
     
     # 2. Category Pie
     ax2 = fig.add_subplot(gs[0, 1])
-    top_cats = df['category'].value_counts().head(6)
+    top_cats = agg['cat_counts'].nlargest(6)
     ax2.pie(top_cats.values, labels=top_cats.index, autopct='%1.1f%%', 
-           colors=plt.cm.Set3(np.linspace(0, 1, len(top_cats))))
+           colors=_palette('Set3', len(top_cats)))
     ax2.set_title('Top Categories')
     
     # 3. AI Techniques Pie
     ax3 = fig.add_subplot(gs[0, 2])
-    top_techs = df['ai_technique'].value_counts().head(6)
+    top_techs = agg['tech_counts'].nlargest(6)
     ax3.pie(top_techs.values, labels=top_techs.index, autopct='%1.1f%%',
-           colors=plt.cm.Pastel1(np.linspace(0, 1, len(top_techs))))
+           colors=_palette('Pastel1', len(top_techs)))
     ax3.set_title('Top AI Techniques')
     
     # 4. Category Bar
     ax4 = fig.add_subplot(gs[1, :2])
-    cats = df['category'].value_counts().head(10)
-    ax4.barh(cats.index[::-1], cats.values[::-1], color=plt.cm.Blues(np.linspace(0.3, 0.9, len(cats)))[::-1])
+    cats = agg['cat_counts'].nlargest(10)
+    ax4.barh(cats.index[::-1], cats.values[::-1], color=_palette('Blues', len(cats), 0.3, 0.9, reverse=True))
     ax4.set_xlabel('Articles')
     ax4.set_title('Category Distribution')
     
     # 5. CE Area Bar
     ax5 = fig.add_subplot(gs[1, 2])
-    areas = df['civil_engineering_area'].value_counts().head(6)
-    ax5.barh(areas.index[::-1], areas.values[::-1], color=plt.cm.Greens(np.linspace(0.3, 0.9, len(areas)))[::-1])
+    areas = agg['area_counts'].nlargest(6)
+    ax5.barh(areas.index[::-1], areas.values[::-1], color=_palette('Greens', len(areas), 0.3, 0.9, reverse=True))
     ax5.set_xlabel('Articles')
     ax5.set_title('CE Areas')
     
     # 6. Timeline
     ax6 = fig.add_subplot(gs[2, :])
-    df_dated = df[df['published_at'].notna()]
-    if len(df_dated) > 0:
-        monthly = df_dated.groupby('year_month').size()
-        monthly = monthly.sort_index()
+    if len(agg['df_dated']) > 0:
+        monthly = agg['monthly']
         ax6.fill_between(range(len(monthly)), monthly.values, alpha=0.4, color=COLORS['primary'])
         ax6.plot(range(len(monthly)), monthly.values, color=COLORS['primary'], linewidth=2)
         ax6.set_xticks(range(0, len(monthly), max(1, len(monthly)//8)))
@@ -529,14 +590,52 @@ def create_summary_dashboard(df, df_rejected):
         ax6.set_title('Publication Timeline')
         ax6.grid(True, alpha=0.3)
     
-    plt.savefig(OUTPUT_DIR / '0_summary_dashboard.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(OUTPUT_DIR / '0_summary_dashboard.png', **SAVE_KW)
+    plt.close(fig)
     print(f"  ✓ Saved: 0_summary_dashboard.png")
 
 
 # =============================================================================
 # MAIN
 # =============================================================================
+ANALYSES = (
+    analysis_1_category_distribution,
+    analysis_2_time_trends,
+    analysis_3_application_stage,
+    analysis_4_keywords,
+    analysis_5_sources,
+    analysis_6_time_topic,
+    analysis_7_civil_eng_areas,
+    analysis_8_ai_techniques,
+)
+
+# Shared inputs inherited by forked workers via copy-on-write
+_WORKER_STATE = {}
+
+
+def _run_analysis(idx):
+    """Run one analysis against the shared DataFrame (worker entry point)"""
+    ANALYSES[idx](_WORKER_STATE['df'], _WORKER_STATE['agg'])
+
+
+def run_analyses(df, agg):
+    """Build the eight analysis figures, in parallel where fork is available"""
+    _WORKER_STATE['df'] = df
+    _WORKER_STATE['agg'] = agg
+
+    try:
+        ctx = multiprocessing.get_context('fork')
+    except ValueError:
+        # No fork (e.g. Windows) - fall back to the sequential path
+        for fn in ANALYSES:
+            fn(df, agg)
+        return
+
+    workers = min(len(ANALYSES), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        list(executor.map(_run_analysis, range(len(ANALYSES))))
+
+
 def main():
     print("="*60)
     print("AI IN CIVIL ENGINEERING: COMPREHENSIVE ANALYSIS")
@@ -545,20 +644,16 @@ def main():
     
     # Load data
     print("Loading data...")
-    df, df_rejected = load_data()
-    print(f"  Loaded {len(df)} accepted + {len(df_rejected)} rejected articles")
+    df, rejected_count = load_data()
+    print(f"  Loaded {len(df)} accepted + {rejected_count} rejected articles")
     print()
-    
-    # Run all analyses
-    analysis_1_category_distribution(df)
-    analysis_2_time_trends(df)
-    analysis_3_application_stage(df)
-    analysis_4_keywords(df)
-    analysis_5_sources(df)
-    analysis_6_time_topic(df)
-    analysis_7_civil_eng_areas(df)
-    analysis_8_ai_techniques(df)
-    create_summary_dashboard(df, df_rejected)
+
+    # Compute shared aggregations once
+    agg = precompute(df)
+
+    # Run all analyses (figures 1-8 render in parallel worker processes)
+    run_analyses(df, agg)
+    create_summary_dashboard(df, agg, rejected_count)
     
     print()
     print("="*60)
@@ -3,21 +3,37 @@ API Collector Module
 Collects articles from news APIs (GNews, NewsAPI, Guardian, etc.)
 """
 
+import atexit
 import hashlib
 import logging
 import os
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import Generator
 from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import yaml
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _utcnow_iso() -> str:
+    """Current UTC time in the pipeline's ISO-8601 'Z' format"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+# One pooled session for every API call: keep-alive reuses the TCP+TLS
+# connection across the several queries sent to each provider host
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+atexit.register(SESSION.close)
+
 
 def load_config() -> dict:
     """Load configuration from sources.yaml"""
@@ -50,15 +66,55 @@ def normalize_url(url: str) -> str:
     return urlunparse((parsed.scheme, domain, path, parsed.params, new_query, ''))
 
 
-def get_url_hash(url: str) -> str:
-    """Generate hash from normalized URL"""
-    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+def get_url_hash(url: str) -> bytes:
+    """Generate 16-byte hash from normalized URL"""
+    return hashlib.sha256(normalize_url(url).encode()).digest()[:16]
+
 
+@lru_cache(maxsize=4096)
+def get_content_hash(title: str, published_at: str) -> bytes:
+    """Generate 16-byte fallback hash from title + date
 
-def get_content_hash(title: str, published_at: str) -> str:
-    """Generate fallback hash from title + date"""
+    blake2b is ~2x faster than SHA-256 on short inputs, and the cache
+    covers titles repeated across paginated/overlapping queries.
+    """
     content = f"{title.lower().strip()}|{published_at[:10] if published_at else ''}"
-    return hashlib.sha256(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+def fetch_queries(base_url: str, params_list: list, timeout: int = 30,
+                  session: requests.Session = None) -> list:
+    """Fetch all query variants concurrently, returning parsed JSON per query
+
+    The collectors are network-bound: issuing the handful of query requests
+    in parallel costs roughly one round trip instead of one per query.
+    Rate limiting is handled reactively - a 429/5xx response is retried with
+    the server's Retry-After (or exponential backoff), so well-behaved runs
+    pay no fixed per-query delay. Failed requests come back as None.
+    """
+    http = session or SESSION
+
+    def fetch(params):
+        for attempt in range(5):
+            try:
+                response = http.get(base_url, params=params, timeout=timeout)
+                if response.status_code == 429 or response.status_code >= 500:
+                    retry_after = response.headers.get('Retry-After')
+                    delay = float(retry_after) if retry_after else 2 ** attempt
+                    logger.warning(f"HTTP {response.status_code} from {base_url}, "
+                                   f"retrying in {delay:.0f}s (attempt {attempt + 1}/5)")
+                    time.sleep(min(delay, 60))
+                    continue
+                response.raise_for_status()
+                # orjson decodes the raw bytes ~3x faster than response.json()
+                return orjson.loads(response.content)
+            except Exception as e:
+                logger.error(f"API request error ({base_url}): {e}")
+                return None
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(8, len(params_list))) as pool:
+        return list(pool.map(fetch, params_list))
 
 
 # ============================================================================
@@ -77,7 +133,9 @@ GNEWS_QUERIES = [
 ]
 
 
-def collect_from_gnews(max_articles: int = 100, seen_hashes: set = None) -> Generator[dict, None, None]:
+def collect_from_gnews(max_articles: int = 100, seen_hashes: set = None,
+                       session: requests.Session = None,
+                       seen_urls: set = None, seen_contents: set = None) -> Generator[dict, None, None]:
     """
     Collect articles from GNews API
     
@@ -88,8 +146,12 @@ def collect_from_gnews(max_articles: int = 100, seen_hashes: set = None) -> Gene
     Yields:
         Article dictionaries
     """
-    if seen_hashes is None:
-        seen_hashes = set()
+    # Back-compat: a single seen_hashes serves both domains when the
+    # split sets aren't provided
+    if seen_urls is None:
+        seen_urls = seen_hashes if seen_hashes is not None else set()
+    if seen_contents is None:
+        seen_contents = seen_hashes if seen_hashes is not None else set()
     
     api_key = os.environ.get('GNEWS_API_KEY')
     if not api_key:
@@ -103,30 +165,28 @@ def collect_from_gnews(max_articles: int = 100, seen_hashes: set = None) -> Gene
     to_date = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
     from_date = (datetime.utcnow() - timedelta(days=365)).strftime('%Y-%m-%dT%H:%M:%SZ')
     
-    for query in GNEWS_QUERIES:
+    params_list = [{
+        'q': query,
+        'lang': 'en',
+        'max': 10,  # Free tier limit
+        'from': from_date,
+        'to': to_date,
+        'sortby': 'relevance',
+        'apikey': api_key
+    } for query in GNEWS_QUERIES]
+
+    logger.info(f"GNews: fetching {len(params_list)} queries concurrently")
+
+    for query, data in zip(GNEWS_QUERIES, fetch_queries(base_url, params_list, session=session)):
         if collected >= max_articles:
             break
-        
-        logger.info(f"GNews query: {query[:50]}...")
-        
-        params = {
-            'q': query,
-            'lang': 'en',
-            'max': 10,  # Free tier limit
-            'from': from_date,
-            'to': to_date,
-            'sortby': 'relevance',
-            'apikey': api_key
-        }
-        
+        if data is None:
+            continue
+
         try:
-            response = requests.get(base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
             articles = data.get('articles', [])
-            logger.info(f"GNews returned {len(articles)} articles for query")
-            
+            logger.info(f"GNews returned {len(articles)} articles for query: {query[:50]}...")
+
             for article in articles:
                 if collected >= max_articles:
                     break
@@ -136,21 +196,19 @@ def collect_from_gnews(max_articles: int = 100, seen_hashes: set = None) -> Gene
                     continue
                 
                 url_hash = get_url_hash(url)
-                if url_hash in seen_hashes:
-                    continue
-                
                 title = article.get('title', '')
-                published_at = article.get('publishedAt', datetime.utcnow().isoformat() + 'Z')
+                published_at = article.get('publishedAt', _utcnow_iso())
                 content_hash = get_content_hash(title, published_at)
-                
-                if content_hash in seen_hashes:
+
+                # URL and content probes hit their own sets, so each probe
+                # only visits its own hash domain
+                if url_hash in seen_urls or content_hash in seen_contents:
                     continue
-                
-                seen_hashes.add(url_hash)
-                seen_hashes.add(content_hash)
+                seen_urls.add(url_hash)
+                seen_contents.add(content_hash)
                 
                 yield {
-                    'id': url_hash[:32],
+                    'id': url_hash.hex(),
                     'title': title,
                     'published_at': published_at,
                     'source_name': article.get('source', {}).get('name', 'Unknown'),
@@ -160,20 +218,14 @@ def collect_from_gnews(max_articles: int = 100, seen_hashes: set = None) -> Gene
                     'author': '',  # GNews doesn't provide author
                     'section': '',
                     'language': 'en',
-                    'retrieved_at': datetime.utcnow().isoformat() + 'Z',
+                    'retrieved_at': _utcnow_iso(),
                     'url_hash': url_hash,
                     'content_hash': content_hash,
                     'api_source': 'gnews'
                 }
                 
                 collected += 1
-            
-            # Rate limiting - be nice to the API
-            time.sleep(1)
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"GNews API error: {e}")
-            continue
+
         except Exception as e:
             logger.error(f"Unexpected error in GNews collection: {e}")
             continue
@@ -185,10 +237,14 @@ def collect_from_gnews(max_articles: int = 100, seen_hashes: set = None) -> Gene
 # NEWSAPI
 # ============================================================================
 
-def collect_from_newsapi(max_articles: int = 50, seen_hashes: set = None) -> Generator[dict, None, None]:
+def collect_from_newsapi(max_articles: int = 50, seen_hashes: set = None,
+                         session: requests.Session = None,
+                         seen_urls: set = None, seen_contents: set = None) -> Generator[dict, None, None]:
     """Collect articles from NewsAPI.org"""
-    if seen_hashes is None:
-        seen_hashes = set()
+    if seen_urls is None:
+        seen_urls = seen_hashes if seen_hashes is not None else set()
+    if seen_contents is None:
+        seen_contents = seen_hashes if seen_hashes is not None else set()
     
     api_key = os.environ.get('NEWSAPI_KEY')
     if not api_key:
@@ -207,26 +263,24 @@ def collect_from_newsapi(max_articles: int = 50, seen_hashes: set = None) -> Gen
     
     from_date = (datetime.utcnow() - timedelta(days=30)).strftime('%Y-%m-%d')
     
-    for query in queries:
+    params_list = [{
+        'q': query,
+        'language': 'en',
+        'sortBy': 'relevance',
+        'from': from_date,
+        'pageSize': 20,
+        'apiKey': api_key
+    } for query in queries]
+
+    logger.info(f"NewsAPI: fetching {len(params_list)} queries concurrently")
+
+    for query, data in zip(queries, fetch_queries(base_url, params_list, session=session)):
         if collected >= max_articles:
             break
-        
-        logger.info(f"NewsAPI query: {query}")
-        
-        params = {
-            'q': query,
-            'language': 'en',
-            'sortBy': 'relevance',
-            'from': from_date,
-            'pageSize': 20,
-            'apiKey': api_key
-        }
-        
+        if data is None:
+            continue
+
         try:
-            response = requests.get(base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
             if data.get('status') != 'ok':
                 logger.warning(f"NewsAPI error: {data.get('message', 'Unknown error')}")
                 continue
@@ -242,21 +296,19 @@ def collect_from_newsapi(max_articles: int = 50, seen_hashes: set = None) -> Gen
                     continue
                 
                 url_hash = get_url_hash(url)
-                if url_hash in seen_hashes:
-                    continue
-                
                 title = article.get('title', '')
-                published_at = article.get('publishedAt', datetime.utcnow().isoformat() + 'Z')
+                published_at = article.get('publishedAt', _utcnow_iso())
                 content_hash = get_content_hash(title, published_at)
-                
-                if content_hash in seen_hashes:
+
+                # URL and content probes hit their own sets, so each probe
+                # only visits its own hash domain
+                if url_hash in seen_urls or content_hash in seen_contents:
                     continue
-                
-                seen_hashes.add(url_hash)
-                seen_hashes.add(content_hash)
+                seen_urls.add(url_hash)
+                seen_contents.add(content_hash)
                 
                 yield {
-                    'id': url_hash[:32],
+                    'id': url_hash.hex(),
                     'title': title,
                     'published_at': published_at,
                     'source_name': article.get('source', {}).get('name', 'Unknown'),
@@ -266,16 +318,14 @@ def collect_from_newsapi(max_articles: int = 50, seen_hashes: set = None) -> Gen
                     'author': article.get('author', ''),
                     'section': '',
                     'language': 'en',
-                    'retrieved_at': datetime.utcnow().isoformat() + 'Z',
+                    'retrieved_at': _utcnow_iso(),
                     'url_hash': url_hash,
                     'content_hash': content_hash,
                     'api_source': 'newsapi'
                 }
                 
                 collected += 1
-            
-            time.sleep(1)
-            
+
         except Exception as e:
             logger.error(f"NewsAPI error: {e}")
             continue
@@ -287,10 +337,14 @@ def collect_from_newsapi(max_articles: int = 50, seen_hashes: set = None) -> Gen
 # GUARDIAN API
 # ============================================================================
 
-def collect_from_guardian(max_articles: int = 50, seen_hashes: set = None) -> Generator[dict, None, None]:
+def collect_from_guardian(max_articles: int = 50, seen_hashes: set = None,
+                          session: requests.Session = None,
+                          seen_urls: set = None, seen_contents: set = None) -> Generator[dict, None, None]:
     """Collect articles from The Guardian Open Platform"""
-    if seen_hashes is None:
-        seen_hashes = set()
+    if seen_urls is None:
+        seen_urls = seen_hashes if seen_hashes is not None else set()
+    if seen_contents is None:
+        seen_contents = seen_hashes if seen_hashes is not None else set()
     
     api_key = os.environ.get('GUARDIAN_API_KEY')
     if not api_key:
@@ -302,25 +356,23 @@ def collect_from_guardian(max_articles: int = 50, seen_hashes: set = None) -> Ge
     
     queries = ['civil engineering', 'construction technology', 'infrastructure AI']
     
-    for query in queries:
+    params_list = [{
+        'q': query,
+        'api-key': api_key,
+        'show-fields': 'headline,bodyText,byline,publication',
+        'page-size': 20,
+        'order-by': 'relevance'
+    } for query in queries]
+
+    logger.info(f"Guardian: fetching {len(params_list)} queries concurrently")
+
+    for query, data in zip(queries, fetch_queries(base_url, params_list, session=session)):
         if collected >= max_articles:
             break
-        
-        logger.info(f"Guardian query: {query}")
-        
-        params = {
-            'q': query,
-            'api-key': api_key,
-            'show-fields': 'headline,bodyText,byline,publication',
-            'page-size': 20,
-            'order-by': 'relevance'
-        }
-        
+        if data is None:
+            continue
+
         try:
-            response = requests.get(base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
             results = data.get('response', {}).get('results', [])
             
             for article in results:
@@ -332,22 +384,18 @@ def collect_from_guardian(max_articles: int = 50, seen_hashes: set = None) -> Ge
                     continue
                 
                 url_hash = get_url_hash(url)
-                if url_hash in seen_hashes:
-                    continue
-                
                 fields = article.get('fields', {})
                 title = fields.get('headline', article.get('webTitle', ''))
-                published_at = article.get('webPublicationDate', datetime.utcnow().isoformat() + 'Z')
+                published_at = article.get('webPublicationDate', _utcnow_iso())
                 content_hash = get_content_hash(title, published_at)
-                
-                if content_hash in seen_hashes:
+
+                if url_hash in seen_urls or content_hash in seen_contents:
                     continue
-                
-                seen_hashes.add(url_hash)
-                seen_hashes.add(content_hash)
+                seen_urls.add(url_hash)
+                seen_contents.add(content_hash)
                 
                 yield {
-                    'id': url_hash[:32],
+                    'id': url_hash.hex(),
                     'title': title,
                     'published_at': published_at,
                     'source_name': 'The Guardian',
@@ -357,16 +405,14 @@ def collect_from_guardian(max_articles: int = 50, seen_hashes: set = None) -> Ge
                     'author': fields.get('byline', ''),
                     'section': article.get('sectionName', ''),
                     'language': 'en',
-                    'retrieved_at': datetime.utcnow().isoformat() + 'Z',
+                    'retrieved_at': _utcnow_iso(),
                     'url_hash': url_hash,
                     'content_hash': content_hash,
                     'api_source': 'guardian'
                 }
                 
                 collected += 1
-            
-            time.sleep(0.5)
-            
+
         except Exception as e:
             logger.error(f"Guardian API error: {e}")
             continue
@@ -378,7 +424,9 @@ def collect_from_guardian(max_articles: int = 50, seen_hashes: set = None) -> Ge
 # MAIN API COLLECTOR
 # ============================================================================
 
-def collect_from_apis(max_articles: int = 250, seen_hashes: set = None) -> Generator[dict, None, None]:
+def collect_from_apis(max_articles: int = 250, seen_hashes: set = None,
+                      session: requests.Session = None,
+                      seen_urls: set = None, seen_contents: set = None) -> Generator[dict, None, None]:
     """
     Collect articles from all available APIs
     
@@ -389,8 +437,10 @@ def collect_from_apis(max_articles: int = 250, seen_hashes: set = None) -> Gener
     Yields:
         Article dictionaries
     """
-    if seen_hashes is None:
-        seen_hashes = set()
+    if seen_urls is None:
+        seen_urls = seen_hashes if seen_hashes is not None else set()
+    if seen_contents is None:
+        seen_contents = seen_hashes if seen_hashes is not None else set()
     
     collected = 0
     
@@ -400,7 +450,8 @@ def collect_from_apis(max_articles: int = 250, seen_hashes: set = None) -> Gener
     
     # GNews (primary)
     logger.info("Starting GNews collection...")
-    for article in collect_from_gnews(gnews_quota, seen_hashes):
+    for article in collect_from_gnews(gnews_quota, session=session,
+                                      seen_urls=seen_urls, seen_contents=seen_contents):
         yield article
         collected += 1
     
@@ -412,7 +463,8 @@ def collect_from_apis(max_articles: int = 250, seen_hashes: set = None) -> Gener
     newsapi_quota = min(50, remaining // 2)
     
     logger.info("Starting NewsAPI collection...")
-    for article in collect_from_newsapi(newsapi_quota, seen_hashes):
+    for article in collect_from_newsapi(newsapi_quota, session=session,
+                                        seen_urls=seen_urls, seen_contents=seen_contents):
         yield article
         collected += 1
     
@@ -424,7 +476,8 @@ def collect_from_apis(max_articles: int = 250, seen_hashes: set = None) -> Gener
     guardian_quota = min(50, remaining)
     
     logger.info("Starting Guardian collection...")
-    for article in collect_from_guardian(guardian_quota, seen_hashes):
+    for article in collect_from_guardian(guardian_quota, session=session,
+                                         seen_urls=seen_urls, seen_contents=seen_contents):
         yield article
         collected += 1
     
@@ -4,15 +4,21 @@ Combines RSS, API, and Scraping collectors to build the complete dataset
 """
 
 import csv
-import json
 import logging
 import os
+import queue
+import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import List
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 import yaml
 
+from dedup import BloomFilter
 from rss_collector import collect_from_rss
 from api_collector import collect_from_apis
 from scrape_collector import collect_from_scraping
@@ -62,28 +68,33 @@ def save_to_csv(articles: List[dict], filepath: str):
         'url', 'full_text', 'author', 'section', 'language', 'retrieved_at'
     ]
     
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-        writer.writeheader()
-        for article in articles:
-            writer.writerow(article)
-    
+    # Plain csv.writer over pre-projected tuples skips DictWriter's
+    # per-field lookup and extras filtering; writerows loops in C
+    with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows((a.get(c, '') for c in columns) for a in articles)
+
     logger.info(f"Saved {len(articles)} articles to {filepath}")
 
 
+# Internal bookkeeping fields stripped before articles are persisted
+DROP_FIELDS = frozenset(['url_hash', 'content_hash', 'feed_url', 'api_source'])
+
+
 def save_to_jsonl(articles: List[dict], filepath: str):
     """Save articles to JSONL file"""
     if not articles:
         logger.warning("No articles to save to JSONL")
         return
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        for article in articles:
-            # Remove internal fields before saving
-            clean_article = {k: v for k, v in article.items() 
-                          if k not in ['url_hash', 'content_hash', 'feed_url', 'api_source']}
-            f.write(json.dumps(clean_article, ensure_ascii=False) + '\n')
-    
+
+    # orjson serializes straight to bytes; one writelines call keeps the
+    # writes inside the buffered I/O layer
+    with open(filepath, 'wb') as f:
+        f.writelines(
+            orjson.dumps({k: v for k, v in article.items() if k not in DROP_FIELDS}) + b'\n'
+            for article in articles)
+
     logger.info(f"Saved {len(articles)} articles to {filepath}")
 
 
@@ -93,18 +104,10 @@ def print_stats(articles: List[dict]):
         print("\nNo articles collected.")
         return
     
-    # Count by source type
-    by_type = {}
-    for article in articles:
-        source_type = article.get('source_type', 'Unknown')
-        by_type[source_type] = by_type.get(source_type, 0) + 1
-    
-    # Count by source name
-    by_source = {}
-    for article in articles:
-        source_name = article.get('source_name', 'Unknown')
-        by_source[source_name] = by_source.get(source_name, 0) + 1
-    
+    # Counter aggregates in C; no manual dict.get/+= per article
+    by_type = Counter(a.get('source_type', 'Unknown') for a in articles)
+    by_source = Counter(a.get('source_name', 'Unknown') for a in articles)
+
     print("\n" + "="*60)
     print("COLLECTION STATISTICS")
     print("="*60)
@@ -115,8 +118,7 @@ def print_stats(articles: List[dict]):
         print(f"  {stype}: {count} ({count/len(articles)*100:.1f}%)")
     
     print("\nTop 10 Sources:")
-    sorted_sources = sorted(by_source.items(), key=lambda x: x[1], reverse=True)[:10]
-    for source, count in sorted_sources:
+    for source, count in by_source.most_common(10):
         print(f"  {source}: {count}")
     
     print("="*60 + "\n")
@@ -145,70 +147,76 @@ def build_raw_dataset(target_total: int = 700):
     ensure_directories()
     
     all_articles = []
-    seen_hashes = set()
+    # Bloom filters instead of sets of hex digests: fixed memory regardless
+    # of how many hashes are tracked, same `in`/.add protocol. One filter
+    # per hash domain, sized for its expected population - URLs vastly
+    # outnumber distinct title+date contents.
+    seen_urls = BloomFilter(capacity=1_000_000, error_rate=1e-6)
+    seen_contents = BloomFilter(capacity=250_000, error_rate=1e-6)
+
+    # Per-phase tallies kept incrementally instead of rescanning all_articles
+    phase_counts = {'RSS': 0, 'API': 0, 'SCRAPE': 0}
+
+    # One pooled session shared by all three collectors so connections to
+    # the same host are reused across phases
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+    session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
     
-    # Phase 1: RSS Collection
+    # All three sources are network-bound and share only the dedup
+    # filters, so they run concurrently feeding one queue; wall-clock
+    # drops from the sum of the phases to roughly the slowest one. A stop
+    # event tells the collector threads to wind down once the target is
+    # reached.
     logger.info("\n" + "="*50)
-    logger.info("PHASE 1: RSS COLLECTION")
+    logger.info("COLLECTING: RSS + API + SCRAPE CONCURRENTLY")
     logger.info("="*50)
-    
-    try:
-        for article in collect_from_rss(max_articles=rss_quota, seen_hashes=seen_hashes):
-            all_articles.append(article)
-            if len(all_articles) >= target_total:
-                break
-    except Exception as e:
-        logger.error(f"RSS collection error: {e}")
-    
-    rss_count = len([a for a in all_articles if a['source_type'] == 'RSS'])
-    logger.info(f"RSS phase complete. Collected: {rss_count}")
-    
-    # Check if we've reached target
-    if len(all_articles) >= target_total:
-        logger.info("Target reached after RSS phase")
-    else:
-        # Phase 2: API Collection
-        logger.info("\n" + "="*50)
-        logger.info("PHASE 2: API COLLECTION")
-        logger.info("="*50)
-        
-        remaining = target_total - len(all_articles)
-        api_target = min(api_quota, remaining)
-        
-        try:
-            for article in collect_from_apis(max_articles=api_target, seen_hashes=seen_hashes):
-                all_articles.append(article)
-                if len(all_articles) >= target_total:
-                    break
-        except Exception as e:
-            logger.error(f"API collection error: {e}")
-        
-        api_count = len([a for a in all_articles if a['source_type'] == 'API'])
-        logger.info(f"API phase complete. Collected: {api_count}")
-    
-    # Check if we need scraping
-    if len(all_articles) >= target_total:
-        logger.info("Target reached after API phase")
-    else:
-        # Phase 3: Web Scraping
-        logger.info("\n" + "="*50)
-        logger.info("PHASE 3: WEB SCRAPING")
-        logger.info("="*50)
-        
-        remaining = target_total - len(all_articles)
-        scrape_target = min(scrape_quota, remaining)
-        
+
+    stop = threading.Event()
+    articles_q = queue.Queue()
+
+    def run_collector(name, collector, quota):
         try:
-            for article in collect_from_scraping(max_articles=scrape_target, seen_hashes=seen_hashes):
-                all_articles.append(article)
-                if len(all_articles) >= target_total:
+            for article in collector(max_articles=quota, seen_urls=seen_urls,
+                                     seen_contents=seen_contents, session=session):
+                if stop.is_set():
                     break
+                articles_q.put(article)
         except Exception as e:
-            logger.error(f"Scraping error: {e}")
-        
-        scrape_count = len([a for a in all_articles if a['source_type'] == 'SCRAPE'])
-        logger.info(f"Scraping phase complete. Collected: {scrape_count}")
-    
+            logger.error(f"{name} collection error: {e}")
+        finally:
+            articles_q.put(None)  # phase-done sentinel
+
+    phases = [
+        ('RSS', collect_from_rss, rss_quota),
+        ('API', collect_from_apis, api_quota),
+        ('SCRAPE', collect_from_scraping, scrape_quota),
+    ]
+    threads = [threading.Thread(target=run_collector, args=phase, daemon=True)
+               for phase in phases]
+    for t in threads:
+        t.start()
+
+    finished = 0
+    while finished < len(threads):
+        article = articles_q.get()
+        if article is None:
+            finished += 1
+            continue
+        if len(all_articles) < target_total:
+            all_articles.append(article)
+            phase_counts[article['source_type']] += 1
+        if len(all_articles) >= target_total:
+            stop.set()
+
+    for t in threads:
+        t.join()
+
+    for name, _, _ in phases:
+        logger.info(f"{name} phase complete. Collected: {phase_counts[name]}")
+
+    session.close()
+
     # Print statistics
     print_stats(all_articles)
     
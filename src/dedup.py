@@ -0,0 +1,99 @@
+"""
+Deduplication Utilities
+Memory-efficient membership structures shared by the collectors
+"""
+
+import hashlib
+import math
+import struct
+
+
+class BloomFilter:
+    """Set-like Bloom filter for the collectors' seen-hash bookkeeping
+
+    Supports the same `x in bf` / `bf.add(x)` protocol the collectors use on
+    a plain set, but stores membership in a fixed bit array instead of Python
+    string objects. False positives are possible (bounded by error_rate),
+    false negatives are not — so at worst an occasional article is dropped
+    as a duplicate, never collected twice.
+    """
+
+    # On-disk layout: magic, then capacity/error_rate/count, then the raw
+    # bit array - enough to rebuild an identical filter
+    _MAGIC = b'CEBF1\n'
+    _HEADER = '<QdQ'
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-6):
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        # Standard sizing: m = -n*ln(p)/ln(2)^2 bits, k = m/n*ln(2) hashes
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def _to_bytes(item) -> bytes:
+        if isinstance(item, bytes):
+            return item
+        if isinstance(item, str):
+            return item.encode()
+        if isinstance(item, tuple):
+            return b'|'.join(BloomFilter._to_bytes(part) for part in item)
+        return repr(item).encode()
+
+    def _positions(self, item):
+        # Double hashing: two 64-bit halves of one blake2b digest generate
+        # all k probe positions without k separate hash calls
+        digest = hashlib.blake2b(self._to_bytes(item), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        new = False
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                new = True
+        if new:
+            self.count += 1
+
+    def __contains__(self, item) -> bool:
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def tofile(self, f):
+        """Write the filter to a binary file object"""
+        f.write(self._MAGIC)
+        f.write(struct.pack(self._HEADER, self.capacity, self.error_rate, self.count))
+        f.write(self.bits)
+
+    @classmethod
+    def fromfile(cls, f) -> 'BloomFilter':
+        """Rebuild a filter written by tofile
+
+        Raises ValueError if the file isn't one of ours or is truncated.
+        """
+        if f.read(len(cls._MAGIC)) != cls._MAGIC:
+            raise ValueError("not a BloomFilter file")
+        header = f.read(struct.calcsize(cls._HEADER))
+        try:
+            capacity, error_rate, count = struct.unpack(cls._HEADER, header)
+        except struct.error as e:
+            raise ValueError(f"corrupt BloomFilter header: {e}")
+        bf = cls(capacity=capacity, error_rate=error_rate)
+        bits = f.read(len(bf.bits))
+        if len(bits) != len(bf.bits):
+            raise ValueError("truncated BloomFilter bit array")
+        bf.bits = bytearray(bits)
+        bf.count = count
+        return bf
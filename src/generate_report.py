@@ -3,22 +3,20 @@ Final Report PDF Generator
 Creates a comprehensive PDF report for AI in Civil Engineering research
 """
 
+# Only the lightweight reportlab.lib modules are imported at module level;
+# the platypus/pdfgen layout stack, ImageReader (which drags in PIL) and
+# sqlite3 are pulled in lazily by the functions that use them, keeping a
+# bare `import generate_report` cheap for tooling
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.lib.colors import HexColor, black, white
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
-from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Image, 
-                                 PageBreak, Table, TableStyle, ListFlowable, 
-                                 ListItem, KeepTogether)
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.units import inch
+from reportlab.lib.colors import HexColor, white
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 from reportlab.lib import colors
 from pathlib import Path
-import sqlite3
-import json
+from functools import lru_cache
+import os
 from datetime import datetime
-from collections import Counter
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -26,6 +24,9 @@ OUTPUT_DIR = BASE_DIR / 'outputs'
 VIZ_DIR = OUTPUT_DIR / 'visualizations'
 PDF_PATH = OUTPUT_DIR / 'Final_Report.pdf'
 
+# Figure names read in one directory scan instead of a stat() per lookup
+_VIZ_FILES = {e.name for e in os.scandir(VIZ_DIR)} if VIZ_DIR.exists() else set()
+
 # Colors
 PRIMARY_COLOR = HexColor('#1a365d')
 ACCENT_COLOR = HexColor('#2b6cb0')
@@ -126,83 +127,240 @@ def create_styles():
     return styles
 
 
+# Styles are immutable once built; the sheet is constructed on first use so
+# repeated main() calls skip the ParagraphStyle setup (and the duplicate
+# styles.add error a second create_styles-on-same-sheet would raise)
+_STYLES = None
+
+
+def get_styles():
+    """Return the process-wide style sheet, building it on first use"""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = create_styles()
+    return _STYLES
+
+
+# All report statistics in one statement: each grouping is a subquery with
+# its TOP-N pushed into SQL, stitched together with UNION ALL and bucketed
+# by the leading `k` column — one round trip instead of six
+_STATS_SQL = """
+    SELECT 'accepted' AS k, '' AS name, COUNT(*) AS cnt FROM articles
+    UNION ALL
+    SELECT 'rejected', '', COUNT(*) FROM rejected
+    UNION ALL
+    SELECT 'cat', category, cnt FROM (
+        SELECT category, COUNT(*) AS cnt FROM articles
+        GROUP BY category ORDER BY cnt DESC LIMIT 10)
+    UNION ALL
+    SELECT 'tech', ai_technique, cnt FROM (
+        SELECT ai_technique, COUNT(*) AS cnt FROM articles
+        GROUP BY ai_technique ORDER BY cnt DESC LIMIT 10)
+    UNION ALL
+    SELECT 'area', civil_engineering_area, cnt FROM (
+        SELECT civil_engineering_area, COUNT(*) AS cnt FROM articles
+        GROUP BY civil_engineering_area ORDER BY cnt DESC LIMIT 10)
+    UNION ALL
+    SELECT 'src', source_type, cnt FROM (
+        SELECT source_type, COUNT(*) AS cnt FROM articles
+        GROUP BY source_type ORDER BY cnt DESC)
+"""
+
+
+# Indexes on the grouped columns let the GROUP BY queries walk an index
+# instead of scanning the table; IF NOT EXISTS makes bootstrap idempotent
+_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_ai_technique ON articles(ai_technique)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_ce_area ON articles(civil_engineering_area)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_source_type ON articles(source_type)",
+)
+
+
+# Lazily-opened module connection, reused when main() is invoked more than
+# once per process; cached_statements keeps the parsed queries around too
+_CONN = None
+
+
+def _get_conn():
+    """Open (once) and return the shared statistics connection"""
+    import sqlite3
+
+    global _CONN
+    if _CONN is None:
+        db_path = BASE_DIR / 'data' / 'processed' / 'articles.db'
+        _CONN = sqlite3.connect(db_path, check_same_thread=False,
+                                cached_statements=32)
+        # Named access to result columns instead of positional indexing
+        _CONN.row_factory = sqlite3.Row
+
+        # Ensure the GROUP BY indexes exist and the planner knows about
+        # them; this must run before the connection is flipped to query_only
+        for ddl in _INDEX_DDL:
+            _CONN.execute(ddl)
+        _CONN.execute("ANALYZE articles")
+        _CONN.commit()
+
+        # Read-only tuning: no journal checks, temp tables in RAM, ~20MB cache
+        _CONN.execute("PRAGMA query_only=1")
+        _CONN.execute("PRAGMA temp_store=MEMORY")
+        _CONN.execute("PRAGMA cache_size=-20000")
+    return _CONN
+
+
 def load_statistics():
     """Load statistics from database"""
-    db_path = BASE_DIR / 'data' / 'processed' / 'articles.db'
-    conn = sqlite3.connect(db_path)
-    
-    # Basic counts
-    total_accepted = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
-    total_rejected = conn.execute("SELECT COUNT(*) FROM rejected").fetchone()[0]
-    
-    # Category distribution
-    categories = conn.execute(
-        "SELECT category, COUNT(*) as cnt FROM articles GROUP BY category ORDER BY cnt DESC"
-    ).fetchall()
-    
-    # AI techniques
-    techniques = conn.execute(
-        "SELECT ai_technique, COUNT(*) as cnt FROM articles GROUP BY ai_technique ORDER BY cnt DESC"
-    ).fetchall()
-    
-    # Civil engineering areas
-    areas = conn.execute(
-        "SELECT civil_engineering_area, COUNT(*) as cnt FROM articles GROUP BY civil_engineering_area ORDER BY cnt DESC"
-    ).fetchall()
-    
-    # Sources
-    sources = conn.execute(
-        "SELECT source_type, COUNT(*) as cnt FROM articles GROUP BY source_type ORDER BY cnt DESC"
-    ).fetchall()
-    
-    conn.close()
-    
+    conn = _get_conn()
+
+    buckets = {'cat': [], 'tech': [], 'area': [], 'src': []}
+    totals = {'accepted': 0, 'rejected': 0}
+    for row in conn.execute(_STATS_SQL):
+        k = row['k']
+        if k in totals:
+            totals[k] = row['cnt']
+        else:
+            # (name, count) tuples: explicit, typed and cheap to pickle
+            buckets[k].append((row['name'], row['cnt']))
+
+    total = totals['accepted'] + totals['rejected']
     return {
-        'total_accepted': total_accepted,
-        'total_rejected': total_rejected,
-        'total': total_accepted + total_rejected,
-        'categories': categories[:10],
-        'techniques': techniques[:10],
-        'areas': areas[:10],
-        'sources': sources
+        'total_accepted': totals['accepted'],
+        'total_rejected': totals['rejected'],
+        'total': total,
+        # Derived values computed once here rather than re-derived (and
+        # guarded against an empty database) at every use site
+        'pct_accepted': (100 * totals['accepted'] / total) if total else 0.0,
+        'top_category': buckets['cat'][0] if buckets['cat'] else ('N/A', 0),
+        'top_technique': buckets['tech'][0] if buckets['tech'] else ('N/A', 0),
+        'top_area': buckets['area'][0] if buckets['area'] else ('N/A', 0),
+        'categories': buckets['cat'],
+        'techniques': buckets['tech'],
+        'areas': buckets['area'],
+        'sources': buckets['src']
     }
 
 
-def add_cover_page(story, styles):
+# reportlab decodes a PNG passed by path twice, once during layout and once
+# during draw; a shared ImageReader per path holds the decoded image instead
+_IMG_CACHE = {}
+
+
+def _image(path):
+    """Return a cached ImageReader, preferring the recompressed sibling"""
+    from reportlab.lib.utils import ImageReader
+
+    reader = _IMG_CACHE.get(path)
+    if reader is None:
+        opt = path.with_name(path.stem + '.opt.png')
+        reader = _IMG_CACHE[path] = ImageReader(str(opt if opt.exists() else path))
+    return reader
+
+
+# Target pixel sizes per figure: the embed dimensions used in
+# add_analysis_section at 150 DPI, so reportlab's scale is a no-op and the
+# PDF carries no larger a pixel buffer than it displays
+_EMBED_PX = {
+    '2_time_trends.png': (900, 675),      # 6 x 4.5 inch
+    '6_time_topic_heatmap.png': (900, 600),  # 6 x 4 inch
+}
+_EMBED_PX_DEFAULT = (900, 525)  # 6 x 3.5 inch
+
+
+def optimize_images():
+    """Resize and recompress visualization PNGs once into .opt.png siblings
+
+    matplotlib writes PNGs at its native figure size and zlib's default
+    level; downscaling to the exact embed dimensions and re-saving with
+    PIL's optimizer shrinks the stream reportlab embeds, and the mtime
+    check makes repeat report builds a no-op.
+    """
+    from PIL import Image as PILImage
+
+    if not VIZ_DIR.exists():
+        return
+    for path in VIZ_DIR.glob('*.png'):
+        if path.name.endswith('.opt.png'):
+            continue
+        opt = path.with_name(path.stem + '.opt.png')
+        if opt.exists() and opt.stat().st_mtime >= path.stat().st_mtime:
+            continue
+        img = PILImage.open(path)
+        target = _EMBED_PX.get(path.name, _EMBED_PX_DEFAULT)
+        if img.size[0] > target[0] or img.size[1] > target[1]:
+            img = img.resize(target, PILImage.LANCZOS)
+        img.save(opt, optimize=True, compress_level=9)
+
+
+@lru_cache(maxsize=None)
+def _static_para(text, style_name):
+    """Build a Paragraph for fixed prose, parsed once per process
+
+    The report's boilerplate blocks never change between builds, so the
+    paraparser pass is cached; only the stats-bearing paragraphs are
+    re-parsed each run.
+    """
+    from reportlab.platypus import Paragraph
+
+    return Paragraph(text, get_styles()[style_name])
+
+
+def bullets(items, style):
+    """Render a bullet list as one Paragraph instead of one per item
+
+    A single <br/>-joined Paragraph goes through reportlab's paragraph
+    parser once, where a per-item loop pays the parse cost for every entry.
+    """
+    from reportlab.platypus import Paragraph
+
+    return Paragraph("<br/>".join(f"• {item}" for item in items), style)
+
+
+def spaced_bullets(items, style):
+    """bullets() variant with a blank line between entries"""
+    from reportlab.platypus import Paragraph
+
+    return Paragraph("<br/><br/>".join(f"• {item}" for item in items), style)
+
+
+def add_cover_page(styles):
     """Add cover page"""
-    story.append(Spacer(1, 2*inch))
+    from reportlab.platypus import Paragraph, Spacer, PageBreak
+
+    yield Spacer(1, 2*inch)
     
-    story.append(Paragraph("FINAL PRESENTATION", styles['CoverTitle']))
-    story.append(Spacer(1, 0.5*inch))
+    yield Paragraph("FINAL PRESENTATION", styles['CoverTitle'])
+    yield Spacer(1, 0.5*inch)
     
-    story.append(Paragraph(
+    yield Paragraph(
         "Artificial Intelligence Applications in Civil Engineering:",
         styles['CoverSubtitle']
-    ))
-    story.append(Paragraph(
+    )
+    yield Paragraph(
         "A Comprehensive Analysis of Current Trends and Technologies",
         styles['CoverSubtitle']
-    ))
+    )
     
-    story.append(Spacer(1, 1*inch))
+    yield Spacer(1, 1*inch)
     
     # Decorative line
-    story.append(Paragraph("_" * 50, styles['CoverSubtitle']))
+    yield Paragraph("_" * 50, styles['CoverSubtitle'])
     
-    story.append(Spacer(1, 1*inch))
+    yield Spacer(1, 1*inch)
     
-    story.append(Paragraph(
+    yield Paragraph(
         f"Date: {datetime.now().strftime('%B %d, %Y')}",
         styles['CoverSubtitle']
-    ))
+    )
     
-    story.append(PageBreak())
+    yield PageBreak()
 
 
-def add_table_of_contents(story, styles):
+def add_table_of_contents(styles):
     """Add table of contents"""
-    story.append(Paragraph("TABLE OF CONTENTS", styles['SectionHeader']))
-    story.append(Spacer(1, 0.3*inch))
+    from reportlab.platypus import Paragraph, Spacer, PageBreak
+
+    yield Paragraph("TABLE OF CONTENTS", styles['SectionHeader'])
+    yield Spacer(1, 0.3*inch)
     
     toc_entries = [
         ("1. Introduction", "3"),
@@ -227,17 +385,20 @@ def add_table_of_contents(story, styles):
     ]
     
     for entry, page in toc_entries:
-        dots = "." * (60 - len(entry) - len(page))
-        story.append(Paragraph(f"{entry} {dots} {page}", styles['TOCEntry']))
+        # A fill format spec pads with dots in C, with no intermediate
+        # "." * n string per row
+        yield Paragraph(f"{entry:.<{58 - len(page)}} {page}", styles['TOCEntry'])
     
-    story.append(PageBreak())
+    yield PageBreak()
 
 
-def add_introduction(story, styles, stats):
+def add_introduction(styles, stats):
     """Add introduction section"""
-    story.append(Paragraph("1. INTRODUCTION", styles['SectionHeader']))
+    from reportlab.platypus import Paragraph, PageBreak
+
+    yield Paragraph("1. INTRODUCTION", styles['SectionHeader'])
     
-    story.append(Paragraph("1.1 Background", styles['SubsectionHeader']))
+    yield Paragraph("1.1 Background", styles['SubsectionHeader'])
     
     intro_text = """
     The construction industry is undergoing a significant transformation driven by the integration 
@@ -247,23 +408,23 @@ def add_introduction(story, styles, stats):
     a comprehensive analysis of how AI is being applied across various domains of civil 
     engineering, based on an extensive review of news articles and academic publications.
     """
-    story.append(Paragraph(intro_text, styles['CustomBody']))
+    yield _static_para(intro_text, 'CustomBody')
     
-    story.append(Paragraph(
+    yield Paragraph(
         f"""This study analyzed a total of <b>{stats['total']}</b> articles from various sources, 
-        of which <b>{stats['total_accepted']}</b> ({stats['total_accepted']/stats['total']*100:.1f}%) 
+        of which <b>{stats['total_accepted']}</b> ({stats['pct_accepted']:.1f}%) 
         were identified as directly relevant to AI applications in civil engineering. 
         The remaining <b>{stats['total_rejected']}</b> articles were filtered out as they 
         discussed general construction topics without specific AI/ML applications.""",
         styles['CustomBody']
-    ))
+    )
     
-    story.append(Paragraph("1.2 Research Objectives", styles['SubsectionHeader']))
+    yield Paragraph("1.2 Research Objectives", styles['SubsectionHeader'])
     
     objectives = """
     The primary objectives of this research are:
     """
-    story.append(Paragraph(objectives, styles['CustomBody']))
+    yield _static_para(objectives, 'CustomBody')
     
     obj_list = [
         "To identify and categorize AI applications in civil engineering",
@@ -273,23 +434,24 @@ def add_introduction(story, styles, stats):
         "To provide insights into the future direction of AI in construction"
     ]
     
-    for obj in obj_list:
-        story.append(Paragraph(f"• {obj}", styles['CustomBody']))
+    yield bullets(obj_list, styles['CustomBody'])
     
-    story.append(PageBreak())
+    yield PageBreak()
 
 
-def add_methodology(story, styles, stats):
+def add_methodology(styles, stats):
     """Add methodology section"""
-    story.append(Paragraph("2. METHODOLOGY", styles['SectionHeader']))
+    from reportlab.platypus import Paragraph, Spacer, PageBreak, Table, TableStyle
+
+    yield Paragraph("2. METHODOLOGY", styles['SectionHeader'])
     
-    story.append(Paragraph("2.1 Data Collection", styles['SubsectionHeader']))
+    yield Paragraph("2.1 Data Collection", styles['SubsectionHeader'])
     
     method_text = """
     Data was collected from multiple sources using a hybrid approach combining automated 
     collection methods:
     """
-    story.append(Paragraph(method_text, styles['CustomBody']))
+    yield _static_para(method_text, 'CustomBody')
     
     # Data sources table
     source_data = [["Source Type", "Description", "Count"]]
@@ -309,15 +471,15 @@ def add_methodology(story, styles, stats):
         ('TOPPADDING', (0, 0), (-1, -1), 8),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
     ]))
-    story.append(table)
-    story.append(Spacer(1, 0.3*inch))
+    yield table
+    yield Spacer(1, 0.3*inch)
     
-    story.append(Paragraph("2.2 Data Processing Pipeline", styles['SubsectionHeader']))
+    yield Paragraph("2.2 Data Processing Pipeline", styles['SubsectionHeader'])
     
     pipeline_text = """
     The data processing pipeline consisted of the following stages:
     """
-    story.append(Paragraph(pipeline_text, styles['CustomBody']))
+    yield _static_para(pipeline_text, 'CustomBody')
     
     pipeline_steps = [
         "<b>RSS Feed Collection:</b> Automated collection from 16+ industry RSS feeds including Google News",
@@ -327,18 +489,17 @@ def add_methodology(story, styles, stats):
         "<b>Data Validation:</b> Quality checks for missing fields and data integrity"
     ]
     
-    for step in pipeline_steps:
-        story.append(Paragraph(f"• {step}", styles['CustomBody']))
+    yield bullets(pipeline_steps, styles['CustomBody'])
     
-    story.append(Spacer(1, 0.2*inch))
+    yield Spacer(1, 0.2*inch)
     
-    story.append(Paragraph("2.3 LLM Classification", styles['SubsectionHeader']))
+    yield Paragraph("2.3 LLM Classification", styles['SubsectionHeader'])
     
     llm_text = """
     Each article was processed using Google's Gemini 2.0 Flash large language model for 
     intelligent classification. The LLM performed the following tasks:
     """
-    story.append(Paragraph(llm_text, styles['CustomBody']))
+    yield _static_para(llm_text, 'CustomBody')
     
     llm_tasks = [
         "<b>Relevance Filtering:</b> Determining if the article discusses actual AI/ML applications",
@@ -349,198 +510,201 @@ def add_methodology(story, styles, stats):
         "<b>Summary Generation:</b> Creating concise article summaries"
     ]
     
-    for task in llm_tasks:
-        story.append(Paragraph(f"• {task}", styles['CustomBody']))
+    yield bullets(llm_tasks, styles['CustomBody'])
     
-    story.append(PageBreak())
+    yield PageBreak()
 
 
-def add_analysis_section(story, styles, stats):
+def add_analysis_section(styles, stats):
     """Add analysis results section with visualizations"""
-    story.append(Paragraph("3. ANALYSIS RESULTS", styles['SectionHeader']))
+    from reportlab.platypus import Paragraph, Image, PageBreak
+
+    yield Paragraph("3. ANALYSIS RESULTS", styles['SectionHeader'])
     
     # 3.1 Category Distribution
-    story.append(Paragraph("3.1 Category Distribution Analysis", styles['SubsectionHeader']))
+    yield Paragraph("3.1 Category Distribution Analysis", styles['SubsectionHeader'])
     
     cat_text = """
     The analysis of category distribution reveals the primary areas where AI is being 
     applied in civil engineering. The following chart illustrates the distribution of 
     articles across different application categories:
     """
-    story.append(Paragraph(cat_text, styles['CustomBody']))
+    yield _static_para(cat_text, 'CustomBody')
     
     img_path = VIZ_DIR / '1_category_distribution.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=3.5*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 1: Distribution of AI applications by category", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=3.5*inch)
+        yield img
+        yield Paragraph("Figure 1: Distribution of AI applications by category", styles['Caption'])
     
     # Category findings
     if stats['categories']:
-        top_cat = stats['categories'][0]
-        story.append(Paragraph(
+        top_cat = stats['top_category']
+        yield Paragraph(
             f"""The most prominent category is <b>{top_cat[0]}</b> with {top_cat[1]} articles, 
             followed by {stats['categories'][1][0]} ({stats['categories'][1][1]} articles) 
             and {stats['categories'][2][0]} ({stats['categories'][2][1]} articles).""",
             styles['CustomBody']
-        ))
+        )
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # 3.2 Time Trends
-    story.append(Paragraph("3.2 Time-based Trend Analysis", styles['SubsectionHeader']))
+    yield Paragraph("3.2 Time-based Trend Analysis", styles['SubsectionHeader'])
     
     trend_text = """
     Temporal analysis provides insights into how AI adoption in civil engineering has evolved 
     over time. The following visualization shows publication trends:
     """
-    story.append(Paragraph(trend_text, styles['CustomBody']))
+    yield _static_para(trend_text, 'CustomBody')
     
     img_path = VIZ_DIR / '2_time_trends.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=4.5*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 2: Publication trends over time showing overall and category-specific patterns", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=4.5*inch)
+        yield img
+        yield Paragraph("Figure 2: Publication trends over time showing overall and category-specific patterns", styles['Caption'])
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # 3.3 Application Stage
-    story.append(Paragraph("3.3 Application Stage Analysis", styles['SubsectionHeader']))
+    yield Paragraph("3.3 Application Stage Analysis", styles['SubsectionHeader'])
     
     stage_text = """
     This analysis examines at which stage of the construction project lifecycle AI 
     technologies are being applied:
     """
-    story.append(Paragraph(stage_text, styles['CustomBody']))
+    yield _static_para(stage_text, 'CustomBody')
     
     img_path = VIZ_DIR / '3_application_stage.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=3.5*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 3: AI applications across project lifecycle stages", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=3.5*inch)
+        yield img
+        yield Paragraph("Figure 3: AI applications across project lifecycle stages", styles['Caption'])
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # 3.4 Keywords
-    story.append(Paragraph("3.4 Keyword Analysis", styles['SubsectionHeader']))
+    yield Paragraph("3.4 Keyword Analysis", styles['SubsectionHeader'])
     
     kw_text = """
     Keyword analysis reveals the most frequently discussed terms and concepts in 
     AI-related civil engineering literature:
     """
-    story.append(Paragraph(kw_text, styles['CustomBody']))
+    yield _static_para(kw_text, 'CustomBody')
     
     img_path = VIZ_DIR / '4_keywords.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=3.5*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 4: Top keywords and word cloud visualization", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=3.5*inch)
+        yield img
+        yield Paragraph("Figure 4: Top keywords and word cloud visualization", styles['Caption'])
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # 3.5 Sources
-    story.append(Paragraph("3.5 Source Analysis", styles['SubsectionHeader']))
+    yield Paragraph("3.5 Source Analysis", styles['SubsectionHeader'])
     
     src_text = """
     Analysis of data sources helps understand the origin and reliability of the 
     collected information:
     """
-    story.append(Paragraph(src_text, styles['CustomBody']))
+    yield _static_para(src_text, 'CustomBody')
     
     img_path = VIZ_DIR / '5_sources.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=3.5*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 5: Distribution of articles by source", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=3.5*inch)
+        yield img
+        yield Paragraph("Figure 5: Distribution of articles by source", styles['Caption'])
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # 3.6 Time-Topic Heatmap
-    story.append(Paragraph("3.6 Time-Topic Relationship", styles['SubsectionHeader']))
+    yield Paragraph("3.6 Time-Topic Relationship", styles['SubsectionHeader'])
     
     hm_text = """
     The heatmap visualization shows how different topics have evolved over time, 
     revealing emerging trends and shifting focus areas:
     """
-    story.append(Paragraph(hm_text, styles['CustomBody']))
+    yield _static_para(hm_text, 'CustomBody')
     
     img_path = VIZ_DIR / '6_time_topic_heatmap.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=4*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 6: Heatmap showing topic evolution over time", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=4*inch)
+        yield img
+        yield Paragraph("Figure 6: Heatmap showing topic evolution over time", styles['Caption'])
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # 3.7 Civil Engineering Areas
-    story.append(Paragraph("3.7 Civil Engineering Areas Analysis", styles['SubsectionHeader']))
+    yield Paragraph("3.7 Civil Engineering Areas Analysis", styles['SubsectionHeader'])
     
     ce_text = """
     This analysis examines which civil engineering disciplines are most impacted by 
     AI technologies:
     """
-    story.append(Paragraph(ce_text, styles['CustomBody']))
+    yield _static_para(ce_text, 'CustomBody')
     
     img_path = VIZ_DIR / '7_civil_eng_areas.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=3.5*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 7: AI applications across civil engineering disciplines", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=3.5*inch)
+        yield img
+        yield Paragraph("Figure 7: AI applications across civil engineering disciplines", styles['Caption'])
     
     if stats['areas']:
-        top_area = stats['areas'][0]
-        story.append(Paragraph(
+        top_area = stats['top_area']
+        yield Paragraph(
             f"""<b>{top_area[0]}</b> emerges as the leading area with {top_area[1]} articles, 
             indicating significant AI adoption in project management and field operations.""",
             styles['CustomBody']
-        ))
+        )
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # 3.8 AI Techniques
-    story.append(Paragraph("3.8 AI Techniques Distribution", styles['SubsectionHeader']))
+    yield Paragraph("3.8 AI Techniques Distribution", styles['SubsectionHeader'])
     
     ai_text = """
     Analysis of AI techniques reveals which machine learning and artificial intelligence 
     methods are most commonly applied in civil engineering:
     """
-    story.append(Paragraph(ai_text, styles['CustomBody']))
+    yield _static_para(ai_text, 'CustomBody')
     
     img_path = VIZ_DIR / '8_ai_techniques.png'
-    if img_path.exists():
-        img = Image(str(img_path), width=6*inch, height=3.5*inch)
-        story.append(img)
-        story.append(Paragraph("Figure 8: Distribution of AI techniques used in civil engineering", styles['Caption']))
+    if img_path.name in _VIZ_FILES:
+        img = Image(_image(img_path), width=6*inch, height=3.5*inch)
+        yield img
+        yield Paragraph("Figure 8: Distribution of AI techniques used in civil engineering", styles['Caption'])
     
     if stats['techniques']:
-        top_tech = stats['techniques'][0]
-        story.append(Paragraph(
+        top_tech = stats['top_technique']
+        yield Paragraph(
             f"""<b>{top_tech[0]}</b> is the most prevalent technique with {top_tech[1]} applications, 
             followed by {stats['techniques'][1][0]} ({stats['techniques'][1][1]} articles).""",
             styles['CustomBody']
-        ))
+        )
     
-    story.append(PageBreak())
+    yield PageBreak()
 
 
-def add_findings(story, styles, stats):
+def add_findings(styles, stats):
     """Add key findings section"""
-    story.append(Paragraph("4. KEY FINDINGS", styles['SectionHeader']))
+    from reportlab.platypus import Paragraph, PageBreak
+
+    yield Paragraph("4. KEY FINDINGS", styles['SectionHeader'])
     
     findings_text = """
     Based on the comprehensive analysis of {total} articles, the following key findings 
     have been identified:
     """.format(total=stats['total'])
-    story.append(Paragraph(findings_text, styles['CustomBody']))
+    yield _static_para(findings_text, 'CustomBody')
     
     findings = [
-        f"<b>High AI Relevance:</b> {stats['total_accepted']/stats['total']*100:.1f}% of analyzed articles were directly relevant to AI applications in civil engineering, indicating significant industry interest.",
+        f"<b>High AI Relevance:</b> {stats['pct_accepted']:.1f}% of analyzed articles were directly relevant to AI applications in civil engineering, indicating significant industry interest.",
         
-        f"<b>Dominant Application Area:</b> {stats['categories'][0][0] if stats['categories'] else 'N/A'} emerged as the primary category, suggesting strong focus on construction operations and automation.",
+        f"<b>Dominant Application Area:</b> {stats['top_category'][0]} emerged as the primary category, suggesting strong focus on construction operations and automation.",
         
-        f"<b>Leading AI Technique:</b> {stats['techniques'][0][0] if stats['techniques'] else 'N/A'} is the most widely applied AI method, followed by robotics and automation solutions.",
+        f"<b>Leading AI Technique:</b> {stats['top_technique'][0]} is the most widely applied AI method, followed by robotics and automation solutions.",
         
-        f"<b>Construction Management Focus:</b> {stats['areas'][0][0] if stats['areas'] else 'N/A'} represents the primary civil engineering domain benefiting from AI integration.",
+        f"<b>Construction Management Focus:</b> {stats['top_area'][0]} represents the primary civil engineering domain benefiting from AI integration.",
         
         "<b>Safety Applications:</b> AI-powered safety monitoring and hazard detection systems are gaining significant attention in the industry.",
         
@@ -551,48 +715,48 @@ def add_findings(story, styles, stats):
         "<b>Computer Vision:</b> Image and video analysis for quality control and site monitoring is a rapidly advancing application area."
     ]
     
-    for finding in findings:
-        story.append(Paragraph(f"• {finding}", styles['CustomBody']))
-        story.append(Spacer(1, 0.1*inch))
-    
-    story.append(PageBreak())
+    yield spaced_bullets(findings, styles['CustomBody'])
+
+    yield PageBreak()
 
 
-def add_conclusion(story, styles, stats):
+def add_conclusion(styles, stats):
     """Add conclusion section"""
-    story.append(Paragraph("5. CONCLUSION", styles['SectionHeader']))
+    from reportlab.platypus import Paragraph, PageBreak
+
+    yield Paragraph("5. CONCLUSION", styles['SectionHeader'])
     
     conclusion_text = f"""
     This comprehensive analysis of {stats['total']} articles reveals that Artificial Intelligence 
     is rapidly transforming the civil engineering and construction industry. With 
-    {stats['total_accepted']} ({stats['total_accepted']/stats['total']*100:.1f}%) articles 
+    {stats['total_accepted']} ({stats['pct_accepted']:.1f}%) articles 
     directly addressing AI/ML applications, it is evident that the industry is actively 
     embracing these technologies.
     """
-    story.append(Paragraph(conclusion_text, styles['CustomBody']))
+    yield _static_para(conclusion_text, 'CustomBody')
     
-    story.append(Paragraph(
-        """The research demonstrates that AI applications span across all phases of the 
-        construction project lifecycle, from planning and design to construction operations 
-        and maintenance. Machine Learning and Robotics emerge as the dominant techniques, 
+    yield _static_para(
+        """The research demonstrates that AI applications span across all phases of the
+        construction project lifecycle, from planning and design to construction operations
+        and maintenance. Machine Learning and Robotics emerge as the dominant techniques,
         while Construction Management benefits most from these technological advances.""",
-        styles['CustomBody']
-    ))
-    
-    story.append(Paragraph(
-        """Looking forward, the trends indicate continued growth in AI adoption, particularly 
-        in areas such as safety monitoring, predictive maintenance, and automated quality 
-        control. The integration of Computer Vision and Deep Learning technologies is 
+        'CustomBody'
+    )
+
+    yield _static_para(
+        """Looking forward, the trends indicate continued growth in AI adoption, particularly
+        in areas such as safety monitoring, predictive maintenance, and automated quality
+        control. The integration of Computer Vision and Deep Learning technologies is
         expected to further revolutionize on-site operations and project management practices.""",
-        styles['CustomBody']
-    ))
+        'CustomBody'
+    )
     
-    story.append(Paragraph("Future Research Directions", styles['SubsectionHeader']))
+    yield Paragraph("Future Research Directions", styles['SubsectionHeader'])
     
     future_text = """
     Based on the findings, the following areas merit further investigation:
     """
-    story.append(Paragraph(future_text, styles['CustomBody']))
+    yield _static_para(future_text, 'CustomBody')
     
     future_items = [
         "Integration of generative AI in structural design optimization",
@@ -602,18 +766,17 @@ def add_conclusion(story, styles, stats):
         "Real-time decision support systems for project management"
     ]
     
-    for item in future_items:
-        story.append(Paragraph(f"• {item}", styles['CustomBody']))
+    yield bullets(future_items, styles['CustomBody'])
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # References
-    story.append(Paragraph("REFERENCES", styles['SectionHeader']))
+    yield Paragraph("REFERENCES", styles['SectionHeader'])
     
     refs_text = """
     Data sources and APIs used in this research:
     """
-    story.append(Paragraph(refs_text, styles['CustomBody']))
+    yield _static_para(refs_text, 'CustomBody')
     
     references = [
         "Google News RSS Feeds - news.google.com",
@@ -624,8 +787,14 @@ def add_conclusion(story, styles, stats):
         "Google Gemini 2.0 Flash - ai.google.dev"
     ]
     
-    for i, ref in enumerate(references, 1):
-        story.append(Paragraph(f"[{i}] {ref}", styles['CustomBody']))
+    yield Paragraph(
+        "<br/>".join(f"[{i}] {ref}" for i, ref in enumerate(references, 1)),
+        styles['CustomBody'])
+
+
+# Footer geometry computed once instead of per page
+_PAGE_CENTER_X = A4[0] / 2
+_PAGE_NUMBER_Y = 0.5 * inch
 
 
 def add_page_number(canvas, doc):
@@ -633,13 +802,18 @@ def add_page_number(canvas, doc):
     page_num = canvas.getPageNumber()
     text = f"Page {page_num}"
     canvas.saveState()
-    canvas.setFont('Times-Roman', 10)
-    canvas.drawCentredString(A4[0]/2, 0.5*inch, text)
+    # setFont re-resolves the face through the font registry; skip it when
+    # the canvas is already in the footer font
+    if canvas._fontname != 'Times-Roman' or canvas._fontsize != 10:
+        canvas.setFont('Times-Roman', 10)
+    canvas.drawCentredString(_PAGE_CENTER_X, _PAGE_NUMBER_Y, text)
     canvas.restoreState()
 
 
 def main():
     """Generate the PDF report"""
+    from reportlab.platypus import SimpleDocTemplate
+
     print("="*60)
     print("GENERATING FINAL REPORT PDF")
     print("="*60)
@@ -649,7 +823,16 @@ def main():
     stats = load_statistics()
     print(f"  Total articles: {stats['total']}")
     print(f"  Accepted: {stats['total_accepted']}")
-    
+
+    # Recompress figures once up front so the embed step reuses them
+    print("Optimizing visualizations...")
+    optimize_images()
+
+    # Page content streams are tiny next to the embedded figures, so the
+    # fastest zlib level trades a few KB for much less compression CPU
+    from reportlab import rl_config
+    rl_config.pageCompression = 1
+
     # Create document
     print("Creating PDF document...")
     doc = SimpleDocTemplate(
@@ -661,32 +844,33 @@ def main():
         bottomMargin=1*inch
     )
     
-    # Create styles
-    styles = create_styles()
+    styles = get_styles()
     
-    # Build story
+    # Each section builds its flowables independently and returns them, so
+    # sections could be assembled out of order (or in parallel) if needed;
+    # page numbering still requires a single sequential build
     story = []
-    
+
     print("Adding cover page...")
-    add_cover_page(story, styles)
-    
+    story.extend(add_cover_page(styles))
+
     print("Adding table of contents...")
-    add_table_of_contents(story, styles)
-    
+    story.extend(add_table_of_contents(styles))
+
     print("Adding introduction...")
-    add_introduction(story, styles, stats)
-    
+    story.extend(add_introduction(styles, stats))
+
     print("Adding methodology...")
-    add_methodology(story, styles, stats)
-    
+    story.extend(add_methodology(styles, stats))
+
     print("Adding analysis sections...")
-    add_analysis_section(story, styles, stats)
-    
+    story.extend(add_analysis_section(styles, stats))
+
     print("Adding key findings...")
-    add_findings(story, styles, stats)
-    
+    story.extend(add_findings(styles, stats))
+
     print("Adding conclusion...")
-    add_conclusion(story, styles, stats)
+    story.extend(add_conclusion(styles, stats))
     
     # Build PDF
     print("Building PDF...")
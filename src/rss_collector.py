@@ -3,11 +3,16 @@ RSS Feed Collector Module
 Collects articles from RSS/Atom feeds defined in config/sources.yaml
 """
 
+import atexit
 import feedparser
 import hashlib
 import logging
+import os
+import re
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Generator
 from pathlib import Path
 
@@ -19,6 +24,23 @@ from dateutil import parser as date_parser
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Patterns used per entry in strip_html, compiled once
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Module session: keep-alive connection reuse across feeds when the caller
+# doesn't pass its own pooled session
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'CivilEngineeringAI-NewsBot/1.0 (Academic Research)'
+})
+atexit.register(_SESSION.close)
+
+def _utcnow_iso() -> str:
+    """Current UTC time in the pipeline's ISO-8601 'Z' format"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
 
 def load_config() -> dict:
     """Load configuration from sources.yaml"""
@@ -27,32 +49,36 @@ def load_config() -> dict:
         return yaml.safe_load(f)
 
 
-def normalize_url(url: str) -> str:
-    """Normalize URL for deduplication"""
-    if not url:
-        return ""
-    
-    # Remove common tracking parameters
-    tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 
-                       'utm_content', 'fbclid', 'gclid', 'ref', 'source']
-    
+# Query parameters that only identify the click, not the article
+TRACKING_PARAMS = frozenset([
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
+    'utm_content', 'fbclid', 'gclid', 'ref', 'source'
+])
+
+# Escape hatch: set RSS_STDLIB_NORMALIZE=1 to route through urllib
+# instead of the handwritten tokenizer below
+_USE_STDLIB_NORMALIZE = os.environ.get('RSS_STDLIB_NORMALIZE') == '1'
+
+
+def _normalize_url_stdlib(url: str) -> str:
+    """urllib-based normalization, kept as reference and fallback"""
     from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-    
+
     parsed = urlparse(url)
-    
+
     # Lowercase domain and remove www
     domain = parsed.netloc.lower()
     if domain.startswith('www.'):
         domain = domain[4:]
-    
+
     # Filter out tracking parameters
     query_params = parse_qs(parsed.query)
-    filtered_params = {k: v for k, v in query_params.items() if k not in tracking_params}
+    filtered_params = {k: v for k, v in query_params.items() if k not in TRACKING_PARAMS}
     new_query = urlencode(filtered_params, doseq=True)
-    
+
     # Remove trailing slash from path
     path = parsed.path.rstrip('/')
-    
+
     # Reconstruct URL
     normalized = urlunparse((
         parsed.scheme,
@@ -62,56 +88,109 @@ def normalize_url(url: str) -> str:
         new_query,
         ''  # Remove fragment
     ))
-    
+
     return normalized
 
 
-def get_url_hash(url: str) -> str:
-    """Generate hash from normalized URL"""
+def normalize_url(url: str) -> str:
+    """Normalize URL for deduplication
+
+    Single-pass str.partition tokenizer: the urlparse -> parse_qs ->
+    urlencode -> urlunparse chain allocates a dict of lists and re-encodes
+    the query for every entry, and this runs once per feed item. Output
+    matches the stdlib version for ordinary feed URLs; odd shapes (no
+    scheme) fall back to it.
+    """
+    if not url:
+        return ""
+    if _USE_STDLIB_NORMALIZE:
+        return _normalize_url_stdlib(url)
+
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        return _normalize_url_stdlib(url)
+
+    # Split host / path / query, tolerating a query before any slash
+    slash = rest.find('/')
+    qmark = rest.find('?')
+    if qmark != -1 and (slash == -1 or qmark < slash):
+        host, path, query = rest[:qmark], '', rest[qmark + 1:]
+    elif slash == -1:
+        host, path, query = rest, '', ''
+    else:
+        host = rest[:slash]
+        path, _, query = rest[slash:].partition('?')
+
+    # Lowercase domain and remove www
+    host = host.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    # Remove trailing slash and any fragment from the path
+    path = path.partition('#')[0].rstrip('/')
+
+    # Drop fragment, tracking parameters and valueless parameters (the
+    # stdlib round-trip discards the latter too)
+    if query:
+        query = query.partition('#')[0]
+        kept = [p for p in query.split('&')
+                if p.partition('=')[2] and p.partition('=')[0] not in TRACKING_PARAMS]
+        query = '&'.join(kept)
+
+    normalized = f"{scheme.lower()}://{host}{path}"
+    return f"{normalized}?{query}" if query else normalized
+
+
+def get_url_hash(url: str) -> bytes:
+    """Generate 16-byte hash from normalized URL"""
     normalized = normalize_url(url)
-    return hashlib.sha256(normalized.encode()).hexdigest()
+    return hashlib.sha256(normalized.encode()).digest()[:16]
+
 
+@lru_cache(maxsize=4096)
+def get_content_hash(title: str, published_at: str) -> bytes:
+    """Generate 16-byte fallback hash from title + date
 
-def get_content_hash(title: str, published_at: str) -> str:
-    """Generate fallback hash from title + date"""
+    blake2b is ~2x faster than SHA-256 on short inputs, and the cache
+    covers titles repeated across paginated/overlapping queries.
+    """
     content = f"{title.lower().strip()}|{published_at[:10] if published_at else ''}"
-    return hashlib.sha256(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
 
 def parse_date(date_str: str) -> str:
     """Parse various date formats to ISO 8601"""
     if not date_str:
-        return datetime.utcnow().isoformat() + 'Z'
+        return _utcnow_iso()
     
     try:
         dt = date_parser.parse(date_str)
         return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
     except Exception:
-        return datetime.utcnow().isoformat() + 'Z'
+        return _utcnow_iso()
 
 
 def strip_html(text: str) -> str:
     """Remove HTML tags from text"""
     if not text:
         return ""
-    
-    import re
-    # Remove HTML tags
-    clean = re.sub(r'<[^>]+>', '', text)
-    # Remove extra whitespace
-    clean = re.sub(r'\s+', ' ', clean).strip()
-    return clean
+
+    # Compiled patterns skip re's cache lookup on every entry
+    return _WS_RE.sub(' ', _TAG_RE.sub('', text)).strip()
 
 
-def fetch_feed(url: str, timeout: int = 30, retries: int = 3) -> feedparser.FeedParserDict | None:
+def fetch_feed(url: str, timeout: int = 30, retries: int = 3,
+               session: requests.Session = None) -> feedparser.FeedParserDict | None:
     """Fetch and parse RSS feed with retries"""
     headers = {
         'User-Agent': 'CivilEngineeringAI-NewsBot/1.0 (Academic Research)'
     }
-    
+
+    http = session or _SESSION
+
     for attempt in range(retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = http.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             feed = feedparser.parse(response.content)
             
@@ -162,22 +241,24 @@ def extract_entry(entry: dict, feed_name: str, feed_url: str) -> dict | None:
         categories = [tag.get('term', '') for tag in entry.get('tags', [])]
         section = categories[0] if categories else ''
         
-        # Generate unique ID
-        url_hash = get_url_hash(link)
+        # Generate unique ID; normalize once and reuse for both the hash
+        # and the stored url - the urlparse chain is the expensive part
+        norm_url = normalize_url(link)
+        url_hash = hashlib.sha256(norm_url.encode()).digest()[:16]
         content_hash = get_content_hash(title, published_at)
-        
+
         return {
-            'id': url_hash[:32],  # Use first 32 chars of hash as ID
+            'id': url_hash.hex(),  # 32-char hex of the 16-byte hash
             'title': title.strip(),
             'published_at': published_at,
             'source_name': feed_name,
             'source_type': 'RSS',
-            'url': normalize_url(link),
+            'url': norm_url,
             'full_text': snippet,  # RSS typically only has snippet, will be enriched later
             'author': author,
             'section': section,
             'language': 'en',
-            'retrieved_at': datetime.utcnow().isoformat() + 'Z',
+            'retrieved_at': _utcnow_iso(),
             'url_hash': url_hash,
             'content_hash': content_hash,
             'feed_url': feed_url
@@ -188,30 +269,36 @@ def extract_entry(entry: dict, feed_name: str, feed_url: str) -> dict | None:
         return None
 
 
-def collect_from_rss(max_articles: int = 300, seen_hashes: set = None) -> Generator[dict, None, None]:
+def collect_from_rss(max_articles: int = 300, seen_hashes: set = None,
+                     session: requests.Session = None,
+                     seen_urls: set = None, seen_contents: set = None) -> Generator[dict, None, None]:
     """
     Collect articles from all configured RSS feeds
-    
+
     Args:
         max_articles: Maximum number of articles to collect
-        seen_hashes: Set of already seen URL hashes for deduplication
-    
+        seen_hashes: Legacy single dedup set serving both hash domains
+        seen_urls: Set of already seen URL hashes
+        seen_contents: Set of already seen content hashes
+
     Yields:
         Article dictionaries
     """
-    if seen_hashes is None:
-        seen_hashes = set()
-    
+    # Back-compat: a single seen_hashes serves both domains when the
+    # split sets aren't provided
+    if seen_urls is None:
+        seen_urls = seen_hashes if seen_hashes is not None else set()
+    if seen_contents is None:
+        seen_contents = seen_hashes if seen_hashes is not None else set()
+
     config = load_config()
     feeds = config.get('RSS_FEEDS', [])
     
     collected = 0
-    
+
+    # Resolve (name, url) for each configured feed up front
+    feed_infos = []
     for feed_config in feeds:
-        if collected >= max_articles:
-            logger.info(f"Reached max articles limit ({max_articles})")
-            break
-        
         # Handle both dict and string formats
         if isinstance(feed_config, dict):
             url = feed_config.get('url')
@@ -219,45 +306,48 @@ def collect_from_rss(max_articles: int = 300, seen_hashes: set = None) -> Genera
         else:
             url = feed_config
             name = url
-        
-        logger.info(f"Fetching RSS feed: {name}")
-        
-        feed = fetch_feed(url)
-        if not feed:
-            logger.warning(f"Failed to fetch feed: {url}")
-            continue
-        
-        entries_collected = 0
-        for entry in feed.entries:
+        feed_infos.append((name, url))
+
+    # Fetch every feed concurrently over a keep-alive session: wall-clock
+    # becomes roughly the slowest feed instead of the sum, and entries are
+    # then deduplicated single-threaded in configured feed order
+    http = session or _SESSION
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(feed_infos)))) as pool:
+        fetched = pool.map(lambda info: fetch_feed(info[1], session=http), feed_infos)
+
+        for (name, url), feed in zip(feed_infos, fetched):
             if collected >= max_articles:
+                logger.info(f"Reached max articles limit ({max_articles})")
                 break
-            
-            article = extract_entry(entry, name, url)
-            if not article:
-                continue
-            
-            # Check for duplicates
-            if article['url_hash'] in seen_hashes:
-                logger.debug(f"Duplicate URL skipped: {article['url']}")
-                continue
-            
-            if article['content_hash'] in seen_hashes:
-                logger.debug(f"Duplicate content skipped: {article['title']}")
+
+            if not feed:
+                logger.warning(f"Failed to fetch feed: {url}")
                 continue
-            
-            # Add to seen hashes
-            seen_hashes.add(article['url_hash'])
-            seen_hashes.add(article['content_hash'])
-            
-            collected += 1
-            entries_collected += 1
-            yield article
-        
-        logger.info(f"Collected {entries_collected} articles from {name}")
-        
-        # Small delay between feeds to be polite
-        time.sleep(0.5)
-    
+
+            entries_collected = 0
+            for entry in feed.entries:
+                if collected >= max_articles:
+                    break
+
+                article = extract_entry(entry, name, url)
+                if not article:
+                    continue
+
+                # URL and content probes hit their own sets, so each
+                # probe only visits its own hash domain
+                if (article['url_hash'] in seen_urls
+                        or article['content_hash'] in seen_contents):
+                    logger.debug(f"Duplicate skipped: {article['url']}")
+                    continue
+                seen_urls.add(article['url_hash'])
+                seen_contents.add(article['content_hash'])
+
+                collected += 1
+                entries_collected += 1
+                yield article
+
+            logger.info(f"Collected {entries_collected} articles from {name}")
+
     logger.info(f"RSS collection complete. Total: {collected} articles")
 
 
@@ -3,23 +3,80 @@ Web Scraping Collector Module
 Scrapes articles from seed URLs with ethical rate limiting
 """
 
+import atexit
 import hashlib
+import json
 import logging
+import os
 import random
 import re
+import socket
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Generator, List
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 
+import lxml.etree
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import yaml
+from dateutil import parser as date_parser
+
+from dedup import BloomFilter
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# lxml tokenizes in C, several times faster than the pure-Python
+# html.parser on typical news pages; kept as a constant so it can be
+# swapped back in one place
+_PARSER = 'lxml'
+
+# Seed pages are only mined for links, so restrict tree construction to
+# <a href>: nothing else on the page ever becomes a Python object
+_DISCOVER_STRAINER = SoupStrainer('a', href=True)
+
+# Request headers don't vary per call, so build the dict once
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    # br cuts transfer ~15-25% vs gzip on sites that serve it; urllib3
+    # decodes it transparently with the brotli package installed
+    'Accept-Encoding': 'gzip, deflate, br',
+}
+
+# Pooled module session: keep-alive reuses the TCP/TLS connection for
+# every article on the same host (a 40-link seed saves ~40 handshakes),
+# and transient 5xx responses retry with backoff at the adapter level
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.5,
+                      status_forcelist=[500, 502, 503, 504]))
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+atexit.register(_SESSION.close)
+
+# Optional DNS cache: many seeds sit behind the same CDN, yet every new
+# connection re-resolves its host (easily tens of ms each). Set
+# SCRAPE_DNS_CACHE=1 to memoize socket.getaddrinfo process-wide. Opt-in
+# because a cached answer never expires, which can bite long-running
+# processes when records rotate.
+if os.environ.get('SCRAPE_DNS_CACHE') == '1':
+    socket.getaddrinfo = lru_cache(maxsize=1024)(socket.getaddrinfo)
+
+def _utcnow_iso() -> str:
+    """Current UTC time in the pipeline's ISO-8601 'Z' format"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
 
 def load_config() -> dict:
     config_path = Path(__file__).parent.parent / "config" / "sources.yaml"
@@ -27,90 +84,268 @@ def load_config() -> dict:
         return yaml.safe_load(f)
 
 
+# Query parameters that only identify the click, not the article
+TRACKING_PARAMS = frozenset([
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
+    'utm_content', 'fbclid', 'gclid', 'ref', 'source'
+])
+
+
+@lru_cache(maxsize=65536)
 def normalize_url(url: str) -> str:
     if not url:
         return ""
-    from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-    tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 
-                       'utm_content', 'fbclid', 'gclid', 'ref', 'source']
+    if '?' not in url and '#' not in url:
+        # Fast path for canonical article URLs (the common case in link
+        # discovery): nothing to filter, so skip the parse_qs/urlencode
+        # round-trip and just case-fold the host and trim the slash
+        scheme, sep, rest = url.partition('://')
+        if sep:
+            host, slash, path = rest.partition('/')
+            host = host.lower()
+            if host.startswith('www.'):
+                host = host[4:]
+            if slash:
+                return f"{scheme.lower()}://{host}" + ('/' + path).rstrip('/')
+            return f"{scheme.lower()}://{host}"
     parsed = urlparse(url)
     domain = parsed.netloc.lower().replace('www.', '') if parsed.netloc.lower().startswith('www.') else parsed.netloc.lower()
     query_params = parse_qs(parsed.query)
-    filtered_params = {k: v for k, v in query_params.items() if k not in tracking_params}
+    filtered_params = {k: v for k, v in query_params.items() if k not in TRACKING_PARAMS}
     new_query = urlencode(filtered_params, doseq=True)
     path = parsed.path.rstrip('/')
     return urlunparse((parsed.scheme, domain, path, parsed.params, new_query, ''))
 
 
-def get_url_hash(url: str) -> str:
-    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+@lru_cache(maxsize=65536)
+def get_url_hash(url: str) -> bytes:
+    # Raw 16-byte digest: dedup sets only need membership, so hex
+    # encoding happens once, at the emitted id field
+    return hashlib.sha256(normalize_url(url).encode()).digest()[:16]
+
+
+@lru_cache(maxsize=4096)
+def _source_name_from_url(url: str) -> str:
+    """Display name from the URL's domain, e.g. 'Enr' for www.enr.com"""
+    return urlparse(url).netloc.replace('www.', '').split('.')[0].title()
 
 
-def get_content_hash(title: str, published_at: str) -> str:
+@lru_cache(maxsize=4096)
+def get_content_hash(title: str, published_at: str) -> bytes:
     content = f"{title.lower().strip()}|{published_at[:10] if published_at else ''}"
-    return hashlib.sha256(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+# Patterns and path fragments used on every page / every link, compiled
+# and materialized once instead of inside the hot loops
+_PAYWALL_INDICATORS = ('paywall', 'subscription-required', 'subscriber-only',
+                       'premium-content', 'members-only')
+_PAYWALL_RE = re.compile('|'.join(_PAYWALL_INDICATORS), re.I)
+# Positive article-URL signals (slug or news/article section) fused into
+# one pattern so each link pays a single regex test
+_ARTICLE_URL_RE = re.compile(r'/(?:news|article)/|/\w+-\w+')
+_SKIP_PATHS = ('/tag/', '/category/', '/author/', '/search/', '/page/',
+               '/feed/', '/about', '/contact')
+_NON_HTTP_PREFIXES = ('mailto:', 'javascript:', 'tel:')
 
 
 def random_delay(min_sec: float = 1.0, max_sec: float = 3.0):
     time.sleep(random.uniform(min_sec, max_sec))
 
 
-def is_paywall_or_blocked(soup: BeautifulSoup, response: requests.Response) -> bool:
+# Worker-thread coordination: one lock serializes dedup-set updates, the
+# other hands out per-host politeness slots so concurrent workers stay
+# rate-limited per host while different hosts overlap freely
+_SEEN_LOCK = threading.Lock()
+_HOST_SLOT_LOCK = threading.Lock()
+_HOST_NEXT_SLOT: dict = {}
+
+# Sized for the whole crawl, not one seed: with per-host pacing in
+# polite_delay, more workers just means more distinct hosts in flight
+_MAX_FETCH_WORKERS = 16
+
+# Page parsing holds the GIL for its Python-level remainder, so with 16
+# fetch threads it all burns one core; a process pool spreads
+# extract_generic (stateless: bytes + url in, dict out) across every
+# core. Started lazily so merely importing this module - including in
+# the workers themselves - never forks.
+_PARSE_POOL = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+            atexit.register(_PARSE_POOL.shutdown)
+        return _PARSE_POOL
+
+
+def polite_delay(host: str, min_sec: float = 1.0, max_sec: float = 3.0):
+    """Sleep until this host's next politeness slot
+
+    Each host's fetches stay min_sec-max_sec apart, same as the old
+    serial random_delay; the slot is reserved under the lock but the
+    sleep happens outside it, so workers on other hosts never wait.
+    """
+    delay = random.uniform(min_sec, max_sec)
+    with _HOST_SLOT_LOCK:
+        now = time.monotonic()
+        slot = max(now, _HOST_NEXT_SLOT.get(host, now))
+        _HOST_NEXT_SLOT[host] = slot + delay
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def is_paywall_or_blocked(response: requests.Response) -> bool:
     if response.status_code in [402, 403]:
         return True
-    paywall_indicators = ['paywall', 'subscription-required', 'subscriber-only', 'premium-content', 'members-only']
-    html_text = str(soup).lower()
-    for indicator in paywall_indicators:
-        if soup.find(class_=re.compile(indicator, re.I)) or soup.find(id=re.compile(indicator, re.I)):
-            return True
+    # Substring scan on the raw HTML first: most pages contain no
+    # indicator at all, and C-level `in` is far cheaper than walking the
+    # DOM, so a tree is only built and probed on a possible hit. Paywall
+    # markup sits in the head or early body, so the first 64 KB suffice.
+    html_text = response.text[:65536].lower()
+    if not any(indicator in html_text for indicator in _PAYWALL_INDICATORS):
+        return False
+    # One fused alternation means two DOM scans total instead of two per
+    # indicator
+    soup = BeautifulSoup(response.content, _PARSER)
+    if soup.find(class_=_PAYWALL_RE) or soup.find(id=_PAYWALL_RE):
+        return True
     return False
 
 
-def get_page(url: str, timeout: int = 30):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-    }
+# Article text is capped at 10k chars downstream, so anything past this
+# (trailing ads, inline JSON-LD, comment widgets) is wasted transfer
+_MAX_PAGE_BYTES = 1_500_000
+
+
+def get_page(url: str, timeout: int = 30, session: requests.Session = None,
+             strainer: SoupStrainer = None):
+    http = session or _SESSION
     try:
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+        response = http.get(url, headers=_HEADERS, timeout=timeout,
+                            allow_redirects=True, stream=True)
         response.raise_for_status()
-        return BeautifulSoup(response.content, 'html.parser'), response
+        # Stream the body and stop at the cap instead of buffering
+        # multi-megabyte pages whole
+        buf = bytearray()
+        for chunk in response.iter_content(64 * 1024):
+            buf += chunk
+            if len(buf) >= _MAX_PAGE_BYTES:
+                break
+        response.close()
+        # Hand the capped body back through the response object so
+        # callers reading response.text keep working
+        response._content = bytes(buf)
+        # A soup is only built when the caller hands in a strainer (the
+        # link-discovery path); article extraction parses the bytes with
+        # lxml directly
+        if strainer is None:
+            return None, response
+        # bytes in, so lxml resolves the document encoding itself
+        return BeautifulSoup(response._content, _PARSER, parse_only=strainer), response
     except Exception as e:
         logger.warning(f"Error fetching {url}: {e}")
         return None, None
 
 
-def extract_generic(soup: BeautifulSoup, url: str) -> dict | None:
+def _extract_json_ld(blob: str) -> dict | None:
+    """Article fields from one ld+json script body, or None if unusable"""
     try:
-        # Find title - use attrs dict to avoid 'name' parameter conflict
-        title_elem = soup.find('h1') or soup.find('meta', attrs={'property': 'og:title'})
-        if not title_elem:
-            return None
-        title = title_elem.get('content', '') if title_elem.name == 'meta' else title_elem.get_text(strip=True)
+        data = json.loads(blob)
+    except ValueError:
+        return None
+    # A block may be a single object, a bare list, or an @graph container
+    if isinstance(data, dict):
+        nodes = data.get('@graph', [data])
+    elif isinstance(data, list):
+        nodes = data
+    else:
+        return None
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        body = node.get('articleBody')
+        if not isinstance(body, str) or len(body) < 200:
+            continue
+        title = str(node.get('headline', '')).strip()
+        if len(title) < 10:
+            continue
+        author = node.get('author', '')
+        if isinstance(author, list):
+            author = author[0] if author else ''
+        if isinstance(author, dict):
+            author = author.get('name', '')
+        return {'title': title, 'published_at': node.get('datePublished'),
+                'author': str(author or ''),
+                'full_text': ' '.join(body.split())[:10000]}
+    return None
+
+
+def extract_generic(content: bytes, url: str) -> dict | None:
+    """Pull title/date/author/body straight from the page bytes with lxml
+
+    Every lookup is a compiled XPath over the C tree; in particular the
+    paragraph text lands in one `.//p//text()` call instead of a Python
+    `get_text` per paragraph, which is the hot loop on long articles.
+    """
+    try:
+        tree = lxml.html.fromstring(content)
+
+        # JSON-LD fast path: most news pages ship a NewsArticle block,
+        # and one json.loads over a bounded handful of scripts is far
+        # cheaper than the heuristic walk below
+        for blob in tree.xpath('//script[@type="application/ld+json"]/text()'):
+            result = _extract_json_ld(blob)
+            if result is not None:
+                return result
+
+        title = ''
+        h1 = tree.find('.//h1')
+        if h1 is not None:
+            title = h1.text_content().strip()
+        if not title:
+            og_title = tree.xpath('//meta[@property="og:title"]/@content')
+            title = og_title[0].strip() if og_title else ''
         if not title or len(title) < 10:
             return None
-        
+
         published_at = None
-        date_elem = soup.find('time') or soup.find('meta', attrs={'property': 'article:published_time'})
-        if date_elem:
-            published_at = date_elem.get('datetime') or date_elem.get('content') or date_elem.get_text(strip=True)
-        
+        date_elem = tree.find('.//time')
+        if date_elem is not None:
+            published_at = date_elem.get('datetime') or date_elem.text_content().strip()
+        else:
+            meta_date = tree.xpath('//meta[@property="article:published_time"]/@content')
+            if meta_date:
+                published_at = meta_date[0]
+
         author = ''
-        # Use attrs dict to avoid conflict with BeautifulSoup's 'name' parameter
-        author_elem = soup.find('meta', attrs={'name': 'author'})
-        if not author_elem:
-            author_elem = soup.find(class_=re.compile('author|byline', re.I))
-        if author_elem:
-            author = author_elem.get('content', '') if author_elem.name == 'meta' else author_elem.get_text(strip=True)
-        
-        body = soup.find('article') or soup.find('div', class_=re.compile('article|content|body', re.I))
+        meta_author = tree.xpath('//meta[@name="author"]/@content')
+        if meta_author:
+            author = meta_author[0]
+        else:
+            # contains() instead of the old regex: byline classes are
+            # lowercase in practice and XPath 1.0 has no case fold
+            byline = tree.xpath('//*[contains(@class, "author") or contains(@class, "byline")]')
+            if byline:
+                author = byline[0].text_content().strip()
+
+        body = tree.find('.//article')
+        if body is None:
+            candidates = tree.xpath('//div[contains(@class, "article") or '
+                                    'contains(@class, "content") or contains(@class, "body")]')
+            body = candidates[0] if candidates else None
         full_text = ''
-        if body:
-            for unwanted in body.find_all(['script', 'style', 'nav', 'footer', 'aside']):
-                unwanted.decompose()
-            paragraphs = body.find_all('p')
-            full_text = ' '.join(p.get_text(strip=True) for p in paragraphs)
-        
+        if body is not None:
+            lxml.etree.strip_elements(body, 'script', 'style', 'nav', 'footer',
+                                      'aside', with_tail=False)
+            # One C call gathers every text node under the paragraphs;
+            # the split/join pass collapses whitespace the way
+            # get_text(strip=True) used to
+            full_text = ' '.join(' '.join(body.xpath('.//p//text()')).split())
+
         if len(full_text) < 200:
             return None
         return {'title': title, 'published_at': published_at, 'author': author, 'full_text': full_text[:10000]}
@@ -121,99 +356,170 @@ def extract_generic(soup: BeautifulSoup, url: str) -> dict | None:
 
 def discover_article_links(soup: BeautifulSoup, base_url: str, max_links: int = 50) -> List[str]:
     links = set()
+    links_add = links.add
+    # The base never changes inside the loop, so parse it once
+    base_netloc = urlparse(base_url).netloc.replace('www.', '')
     for link in soup.find_all('a', href=True):
         href = link.get('href')
-        if href:
-            full_url = urljoin(base_url, href)
-            parsed = urlparse(full_url)
-            base_parsed = urlparse(base_url)
-            if parsed.netloc.endswith(base_parsed.netloc.replace('www.', '')):
-                path = parsed.path.lower()
-                skip = ['/tag/', '/category/', '/author/', '/search/', '/page/', '/feed/', '/about', '/contact']
-                if not any(s in path for s in skip) and len(path) > 5:
-                    if re.search(r'/[\w]+-[\w]+', path) or '/news/' in path or '/article/' in path:
-                        links.add(full_url)
+        # Cheap prefix rejects (fragments, mailto:, javascript:) before
+        # paying for urljoin + urlparse
+        if not href or href[0] in ('#', '?') or href.startswith(_NON_HTTP_PREFIXES):
+            continue
+        full_url = urljoin(base_url, href)
+        parsed = urlparse(full_url)
+        if not parsed.netloc.endswith(base_netloc):
+            continue
+        path = parsed.path.lower()
+        if (len(path) > 5 and not any(s in path for s in _SKIP_PATHS)
+                and _ARTICLE_URL_RE.search(path)):
+            links_add(full_url)
     return list(links)[:max_links]
 
 
-def scrape_article(url: str, seen_hashes: set) -> dict | None:
+def scrape_article(url: str, seen_urls: set, seen_contents: set,
+                   session: requests.Session = None,
+                   bloom: BloomFilter = None) -> dict | None:
+    norm_url = normalize_url(url)
     url_hash = get_url_hash(url)
-    if url_hash in seen_hashes:
-        return None
-    random_delay(1.0, 3.0)
-    soup, response = get_page(url)
-    if not soup or not response:
+    # Fast reject on the URL alone, before paying the fetch: the bloom
+    # holds every URL this crawler has landed, including in previous
+    # runs, while seen_urls covers what the other collectors saw this
+    # run. The content probe has to wait until the page is parsed.
+    with _SEEN_LOCK:
+        if (bloom is not None and url_hash in bloom) or url_hash in seen_urls:
+            return None
+    polite_delay(urlparse(url).netloc)
+    _, response = get_page(url, session=session)
+    if response is None:
         return None
-    if is_paywall_or_blocked(soup, response):
+    if is_paywall_or_blocked(response):
         logger.info(f"Paywall detected: {url}")
         return None
-    result = extract_generic(soup, url)
+    # The fetch thread parks while a pool worker does the lxml parse on
+    # another core
+    result = _parse_pool().submit(extract_generic, response.content, url).result()
     if not result:
         return None
     
-    from dateutil import parser as date_parser
     published_at = result.get('published_at', '')
     try:
         dt = date_parser.parse(published_at) if published_at else datetime.utcnow()
         published_at = dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-    except:
-        published_at = datetime.utcnow().isoformat() + 'Z'
+    except (ValueError, TypeError, OverflowError):
+        published_at = _utcnow_iso()
     
     content_hash = get_content_hash(result['title'], published_at)
-    if content_hash in seen_hashes:
-        return None
-    seen_hashes.add(url_hash)
-    seen_hashes.add(content_hash)
-    
-    domain = urlparse(url).netloc.replace('www.', '').split('.')[0].title()
+    with _SEEN_LOCK:
+        # Re-probe the URL (another worker may have landed it while this
+        # fetch was in flight) and check the content domain
+        if (bloom is not None and url_hash in bloom) or url_hash in seen_urls \
+                or content_hash in seen_contents:
+            return None
+        if bloom is not None:
+            bloom.add(url_hash)
+        seen_urls.add(url_hash)
+        seen_contents.add(content_hash)
+
     return {
-        'id': url_hash[:32], 'title': result['title'], 'published_at': published_at,
-        'source_name': domain, 'source_type': 'SCRAPE', 'url': normalize_url(url),
+        'id': url_hash.hex(), 'title': result['title'], 'published_at': published_at,
+        'source_name': _source_name_from_url(url), 'source_type': 'SCRAPE', 'url': norm_url,
         'full_text': result['full_text'], 'author': result.get('author', ''),
-        'section': '', 'language': 'en', 'retrieved_at': datetime.utcnow().isoformat() + 'Z',
+        'section': '', 'language': 'en', 'retrieved_at': _utcnow_iso(),
         'url_hash': url_hash, 'content_hash': content_hash
     }
 
 
-def collect_from_scraping(max_articles: int = 150, seen_hashes: set = None) -> Generator[dict, None, None]:
-    if seen_hashes is None:
-        seen_hashes = set()
+# Dedup state carried between runs: a run that re-crawls the same seeds
+# skips every URL already scraped instead of re-fetching it
+_SEEN_BLOOM_PATH = Path(__file__).parent.parent / 'data' / 'seen_urls.bloom'
+_SEEN_BLOOM_SAVE_EVERY = 25
+
+
+def _load_seen_bloom() -> BloomFilter:
+    """Load the persisted URL filter, or start a fresh one"""
+    try:
+        with open(_SEEN_BLOOM_PATH, 'rb') as f:
+            bloom = BloomFilter.fromfile(f)
+        logger.info(f"Loaded {len(bloom)} previously seen URLs from {_SEEN_BLOOM_PATH}")
+        return bloom
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        logger.warning(f"Ignoring unreadable dedup state {_SEEN_BLOOM_PATH}: {e}")
+    return BloomFilter(capacity=100_000, error_rate=1e-4)
+
+
+def _save_seen_bloom(bloom: BloomFilter):
+    """Persist the URL filter atomically (write-then-rename)"""
+    _SEEN_BLOOM_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _SEEN_BLOOM_PATH.with_suffix('.bloom.tmp')
+    with open(tmp, 'wb') as f:
+        bloom.tofile(f)
+    tmp.replace(_SEEN_BLOOM_PATH)
+
+
+def collect_from_scraping(max_articles: int = 150, seen_hashes: set = None,
+                          session: requests.Session = None,
+                          seen_urls: set = None, seen_contents: set = None) -> Generator[dict, None, None]:
+    # Back-compat: a single seen_hashes serves both domains when the
+    # split sets aren't provided
+    if seen_urls is None:
+        seen_urls = seen_hashes if seen_hashes is not None else set()
+    if seen_contents is None:
+        seen_contents = seen_hashes if seen_hashes is not None else set()
+    # Every URL ever scraped, carried across runs; network is the biggest
+    # cost, so skipping re-fetches of old articles dwarfs everything else
+    bloom = _load_seen_bloom()
     config = load_config()
     seeds = config.get('SCRAPE_SEEDS', [])
     collected = 0
     
-    for seed_config in seeds:
-        if collected >= max_articles:
-            break
-        seed_url = seed_config.get('url') if isinstance(seed_config, dict) else seed_config
-        seed_name = seed_config.get('name', seed_url) if isinstance(seed_config, dict) else seed_url
-        max_depth = seed_config.get('max_depth', 1) if isinstance(seed_config, dict) else 1
-        
-        logger.info(f"Processing seed: {seed_name}")
-        random_delay(1.0, 2.0)
-        soup, response = get_page(seed_url)
-        if not soup:
-            continue
-        
-        if max_depth == 0:
-            article = scrape_article(seed_url, seen_hashes)
-            if article:
-                yield article
-                collected += 1
-            continue
-        
-        article_urls = discover_article_links(soup, seed_url, max_links=40)
-        logger.info(f"Found {len(article_urls)} links from {seed_name}")
-        
-        for article_url in article_urls:
+    # One pool spans every seed: article fetches from all seeds share the
+    # workers, so a seed full of slow hosts no longer holds up the rest of
+    # the crawl the way the old per-seed pools did. polite_delay still
+    # paces each host individually.
+    with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as pool:
+        futures = []
+        for seed_config in seeds:
+            seed_url = seed_config.get('url') if isinstance(seed_config, dict) else seed_config
+            seed_name = seed_config.get('name', seed_url) if isinstance(seed_config, dict) else seed_url
+            max_depth = seed_config.get('max_depth', 1) if isinstance(seed_config, dict) else 1
+
+            logger.info(f"Processing seed: {seed_name}")
+            random_delay(1.0, 2.0)
+            # Seed pages are only mined for links, so parse nothing but <a href>
+            soup, response = get_page(seed_url, session=session,
+                                      strainer=_DISCOVER_STRAINER)
+            if not soup:
+                continue
+
+            if max_depth == 0:
+                futures.append(pool.submit(scrape_article, seed_url, seen_urls,
+                                           seen_contents, session, bloom))
+                continue
+
+            article_urls = discover_article_links(soup, seed_url, max_links=40)
+            logger.info(f"Found {len(article_urls)} links from {seed_name}")
+            futures.extend(pool.submit(scrape_article, u, seen_urls, seen_contents,
+                                       session, bloom)
+                           for u in article_urls)
+
+        for future in as_completed(futures):
             if collected >= max_articles:
+                for pending in futures:
+                    pending.cancel()
                 break
-            article = scrape_article(article_url, seen_hashes)
+            article = future.result()
             if article:
                 yield article
                 collected += 1
                 logger.info(f"Scraped ({collected}/{max_articles}): {article['title'][:50]}...")
-    
+                # Checkpoint the filter as we go so a crash doesn't cost
+                # the whole run's dedup state
+                if collected % _SEEN_BLOOM_SAVE_EVERY == 0:
+                    _save_seen_bloom(bloom)
+
+    _save_seen_bloom(bloom)
     logger.info(f"Scraping complete. Total: {collected}")
 
 